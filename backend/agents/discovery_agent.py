@@ -3,14 +3,28 @@ Single discovery agent using Claude API
 """
 import json
 import os
-from anthropic import Anthropic
 
-# Initialize Claude client
-ANTHROPIC_API_KEY = os.environ.get('ANTHROPIC_API_KEY')
-if not ANTHROPIC_API_KEY:
-    raise ValueError("ANTHROPIC_API_KEY environment variable not set")
+from startup import profiled
+
+# Claude client, created on first use so importing this module never needs
+# the anthropic package or an API key
+_claude_client = None
+
+
+def get_claude_client():
+    """Return the shared Claude client, creating it on first call"""
+    global _claude_client
+    
+    if _claude_client is None:
+        api_key = os.environ.get('ANTHROPIC_API_KEY')
+        if not api_key:
+            raise ValueError("ANTHROPIC_API_KEY environment variable not set")
+        
+        with profiled('anthropic'):
+            from anthropic import Anthropic
+        _claude_client = Anthropic(api_key=api_key)
+    return _claude_client
 
-claude_client = Anthropic(api_key=ANTHROPIC_API_KEY)
 
 def run_discovery_agent(question: str, path_data: dict) -> dict:
     """
@@ -31,7 +45,7 @@ def run_discovery_agent(question: str, path_data: dict) -> dict:
     print(f"🤖 Discovery Agent analyzing pathway...")
     
     # Call Claude
-    response = claude_client.messages.create(
+    response = get_claude_client().messages.create(
         model="claude-sonnet-4-20250514",
         max_tokens=2000,
         messages=[{
@@ -1,12 +1,27 @@
-from flask import Flask, jsonify, send_from_directory, request, Response, stream_with_context
-from flask_cors import CORS
+from startup import STARTUP_PROFILE, Subsystem, SubsystemUnavailable, print_startup_profile, profiled, startup_profile
+
+# Each entry records the incremental time of its first import
+with profiled('flask'):
+    from flask import Flask, jsonify, send_from_directory, request, Response, stream_with_context
+with profiled('flask_cors'):
+    from flask_cors import CORS
 import os
 import json
-import anthropic
+import threading
 import time
 
-from tools.graph_tools import bfs_find_paths, generate_mechanism_summary, score_repurposing_opportunity
-from agents.discovery_agent import run_discovery_agent
+with profiled('tools.graph_tools'):
+    from tools.graph_tools import build_graph_index
+with profiled('discovery'):
+    from discovery import search_hypothesis, build_discovery_result
+with profiled('publication_stream'):
+    from publication_stream import PublicationIngest, READ_CHUNK_SIZE
+with profiled('jobs.job_store'):
+    from jobs.job_store import JobStore
+with profiled('jobs.job_manager'):
+    from jobs.job_manager import JobManager
+with profiled('agents.discovery_agent'):
+    from agents.discovery_agent import run_discovery_agent, get_claude_client
 
 # CML project directory
 if os.path.exists('/home/cdsw'):
@@ -20,29 +35,106 @@ app = Flask(__name__,
 
 CORS(app)
 
-# Load seed graph
 SEED_GRAPH_PATH = os.path.join(PROJECT_DIR, 'data/seed_graph.json')
-with open(SEED_GRAPH_PATH, 'r') as f:
-    SEED_GRAPH = json.load(f)
 
-print(f"✓ Loaded seed graph: {len(SEED_GRAPH['entities'])} entities, {len(SEED_GRAPH['relationships'])} relationships")
+# Batch job settings
+JOBS_DB_PATH = os.environ.get('JOBS_DB_PATH', os.path.join(PROJECT_DIR, 'data/jobs.db'))
+JOB_SEARCH_WORKERS = int(os.environ.get('JOB_SEARCH_WORKERS', os.cpu_count() or 1))
+JOB_LLM_CONCURRENCY = int(os.environ.get('JOB_LLM_CONCURRENCY', 4))
+MAX_JOB_HYPOTHESES = 1000
+JOB_STREAM_IDLE_SECONDS = int(os.environ.get('JOB_STREAM_IDLE_SECONDS', 300))
+
+# How long a request waits for a subsystem that is still initializing
+SUBSYSTEM_WAIT_SECONDS = 30
+
 
-# Initialize Claude client
-claude_client = None
-ANTHROPIC_API_KEY = os.environ.get('ANTHROPIC_API_KEY')
+def load_graph() -> dict:
+    """Load the seed graph and build its path search lookup tables"""
+    with open(SEED_GRAPH_PATH, 'r') as f:
+        seed_graph = json.load(f)
+    
+    print(f"✓ Loaded seed graph: {len(seed_graph['entities'])} entities, {len(seed_graph['relationships'])} relationships")
+    
+    return {
+        'graph': seed_graph,
+        'index': build_graph_index(seed_graph)
+    }
 
-if ANTHROPIC_API_KEY:
-    claude_client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+
+def load_llm_client():
+    """Create the Claude client shared by triplet extraction and the discovery agent"""
+    client = get_claude_client()
     print("✓ Claude API client initialized")
-else:
-    print("⚠️  Warning: ANTHROPIC_API_KEY not set")
+    return client
+
+
+def load_job_manager() -> JobManager:
+    """Start the batch job worker pools and resume unfinished jobs"""
+    manager = JobManager(
+        JobStore(JOBS_DB_PATH),
+        SEED_GRAPH_PATH,
+        search_workers=JOB_SEARCH_WORKERS,
+        llm_concurrency=JOB_LLM_CONCURRENCY
+    )
+    manager.resume()
+    print(f"✓ Job manager started: {JOB_SEARCH_WORKERS} search workers, {JOB_LLM_CONCURRENCY} LLM slots")
+    return manager
+
+
+GRAPH = Subsystem('graph', load_graph)
+LLM = Subsystem('llm', load_llm_client)
+JOBS = Subsystem('jobs', load_job_manager)
+SUBSYSTEMS = [GRAPH, LLM, JOBS]
+
+_profile_report_started = False
+
+
+def get_seed_graph() -> dict:
+    return GRAPH.get(SUBSYSTEM_WAIT_SECONDS)['graph']
+
+
+def get_graph_index() -> dict:
+    return GRAPH.get(SUBSYSTEM_WAIT_SECONDS)['index']
+
+
+def get_job_manager() -> JobManager:
+    """Return the shared JobManager, starting it on first call"""
+    return JOBS.get(SUBSYSTEM_WAIT_SECONDS)
+
+
+def start_background_init(include_jobs: bool = False) -> None:
+    """
+    Warm up subsystems in background threads; requests that need one
+    before it is ready wait for it (or initialize it themselves)
+    
+    Called once by the server entry points (`__main__`, cml_app.main), not
+    at import time: spawned job workers re-import this module and must not
+    load the graph or the Claude client.
+    """
+    global _profile_report_started
+    
+    GRAPH.start()
+    LLM.start()
+    if include_jobs:
+        JOBS.start()
+    
+    # Report once, after every subsystem this process warms up has started
+    if STARTUP_PROFILE and not _profile_report_started:
+        _profile_report_started = True
+        
+        def report():
+            for subsystem in SUBSYSTEMS:
+                if subsystem.state != 'not_started':
+                    subsystem.wait()
+            print_startup_profile()
+        
+        threading.Thread(target=report, name='startup-profile', daemon=True).start()
 
 
 def extract_triplets_with_claude(text: str) -> list:
     """Extract knowledge triplets from text using Claude"""
     
-    if not claude_client:
-        raise Exception("Claude API client not initialized. Set ANTHROPIC_API_KEY environment variable.")
+    claude_client = LLM.get(SUBSYSTEM_WAIT_SECONDS)
     
     # Load prompt template
     prompt_path = os.path.join(PROJECT_DIR, 'prompts/extract_triplets.txt')
@@ -85,18 +177,52 @@ def hello():
 
 @app.route('/api/health', methods=['GET'])
 def health():
-    """Health check endpoint"""
+    """
+    Health check endpoint with per-subsystem readiness
+    
+    status is 'starting' until the graph is loaded, 'healthy' when nothing
+    has failed and 'degraded' when a subsystem (e.g. the LLM client without
+    an API key) failed but graph endpoints still work
+    """
+    subsystems = {subsystem.name: subsystem.status() for subsystem in SUBSYSTEMS}
+    
+    if GRAPH.state != 'ready':
+        status = 'starting' if GRAPH.state != 'failed' else 'degraded'
+    elif any(subsystem.state == 'failed' for subsystem in SUBSYSTEMS):
+        status = 'degraded'
+    else:
+        status = 'healthy'
+    
+    response = {
+        'status': status,
+        'subsystems': subsystems
+    }
+    
+    if GRAPH.state == 'ready':
+        seed_graph = get_seed_graph()
+        response['graph_entities'] = len(seed_graph['entities'])
+        response['graph_relationships'] = len(seed_graph['relationships'])
+    
+    if STARTUP_PROFILE or request.args.get('profile'):
+        response['startup_profile'] = startup_profile()
+    
+    return jsonify(response)
+
+
+@app.errorhandler(SubsystemUnavailable)
+def subsystem_unavailable(e):
     return jsonify({
-        'status': 'healthy',
-        'graph_entities': len(SEED_GRAPH['entities']),
-        'graph_relationships': len(SEED_GRAPH['relationships'])
-    })
+        'success': False,
+        'error': str(e)
+    }), 503
 
 
 @app.route('/api/graph-data', methods=['GET'])
 def get_graph_data():
     """Return graph data in format for react-force-graph"""
     
+    seed_graph = get_seed_graph()
+    
     # Transform to nodes/links format
     nodes = [
         {
@@ -106,7 +232,7 @@ def get_graph_data():
             'group': entity['type'],
             'knowledge_source': entity.get('knowledge_source', 'unknown')
         }
-        for entity in SEED_GRAPH['entities']
+        for entity in seed_graph['entities']
     ]
     
     links = [
@@ -116,7 +242,7 @@ def get_graph_data():
             'label': rel['relation'],
             'confidence': rel.get('confidence', 0.5)
         }
-        for rel in SEED_GRAPH['relationships']
+        for rel in seed_graph['relationships']
     ]
     
     return jsonify({
@@ -156,11 +282,13 @@ def upload_publication():
         return jsonify({
             'success': True,
             'filename': file.filename,
-            'content': content,
+            'characters': len(content),
             'triplets': triplets,
             'triplet_count': len(triplets)
         })
     
+    except SubsystemUnavailable:
+        raise
     except Exception as e:
         print(f"❌ Upload error: {e}")
         return jsonify({
@@ -169,9 +297,71 @@ def upload_publication():
         }), 500
 
 
-def generate_discovery_stream(question: str):
+@app.route('/api/upload-publications-stream', methods=['POST'])
+def upload_publications_stream():
+    """
+    Streaming publication upload, reported over Server-Sent Events
+    
+    Accepts multipart/form-data with any number of files (text, .zip or
+    .tar/.tar.gz archives of text files), or a raw text/archive body with
+    the filename in the X-Filename header. The body is read in chunks and
+    extracted triplets are streamed back per file chunk.
+    """
+    content_type = request.mimetype
+    boundary = request.mimetype_params.get('boundary')
+    
+    if content_type == 'multipart/form-data' and not boundary:
+        return jsonify({'success': False, 'error': 'Missing multipart boundary'}), 400
+    
+    # Fail fast with 503 before streaming if the LLM client is unavailable
+    LLM.get(SUBSYSTEM_WAIT_SECONDS)
+    
+    ingest = PublicationIngest(extract_triplets_with_claude)
+    body_chunks = iter(lambda: request.stream.read(READ_CHUNK_SIZE), b'')
+    
+    if content_type == 'multipart/form-data':
+        events = ingest.ingest_multipart(body_chunks, boundary.encode('latin-1'), request.content_length)
+    else:
+        filename = request.headers.get('X-Filename', 'publication.txt')
+        events = ingest.ingest_raw(body_chunks, filename, request.content_length)
+    
+    def generate():
+        try:
+            for event in events:
+                yield f"data: {json.dumps(event)}\n\n"
+        except Exception as e:
+            print(f"❌ Upload stream error: {e}")
+            yield f"data: {json.dumps({'step': 'error', 'message': f'Error: {str(e)}', 'progress': 100})}\n\n"
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+
+def parse_max_paths(data: dict):
+    """
+    Validate the optional 'max_paths' request field
+    
+    Returns a non-negative int, or None if the value is not a non-negative
+    JSON integer (booleans, floats and numeric strings are rejected)
+    """
+    max_paths = data.get('max_paths', 0)
+    if isinstance(max_paths, bool) or not isinstance(max_paths, int):
+        return None
+    return max_paths if max_paths >= 0 else None
+
+
+def generate_discovery_stream(question: str, max_paths: int = 0):
     """
     Generator function that yields discovery progress events
+
+    When max_paths is set, the result includes the top paths in the compact
+    PathSet wire format (see tools/path_set.py)
     """
     try:
         # Step 1: Parse question
@@ -188,85 +378,34 @@ def generate_discovery_stream(question: str):
         # Step 2: Graph search
         yield f"data: {json.dumps({'step': 'searching', 'message': '🧬 Searching knowledge graph...', 'progress': 30})}\n\n"
         
-        paths = bfs_find_paths(
-            SEED_GRAPH,
-            start_entity=drug_name,
-            target_entity=disease_name,
-            max_depth=10
+        search = search_hypothesis(
+            get_seed_graph(),
+            drug_name,
+            disease_name,
+            max_depth=10,
+            max_paths=max_paths,
+            graph_index=get_graph_index()
         )
         
-        if not paths:
+        if not search:
             yield f"data: {json.dumps({'step': 'error', 'message': 'No paths found', 'progress': 100})}\n\n"
             return
         
-        yield f"data: {json.dumps({'step': 'paths_found', 'message': f'📊 Found {len(paths)} possible pathways', 'progress': 50})}\n\n"
+        path_count = search['path_count']
+        yield f"data: {json.dumps({'step': 'paths_found', 'message': f'📊 Found {path_count} possible pathways', 'progress': 50})}\n\n"
         time.sleep(0.5)
         
-        top_path = paths[0]
-        
         # Step 3: Agent analysis
         yield f"data: {json.dumps({'step': 'agent_analyzing', 'message': '🤖 AI Agent analyzing pathway...', 'progress': 60})}\n\n"
         
-        # Prepare path data for agent
-        path_data = {
-            'nodes': [n['name'] for n in top_path['node_details']],
-            'node_types': [n['type'] for n in top_path['node_details']],
-            'edges': top_path['edges'],
-            'edge_details': top_path['edge_details'],
-            'confidence': top_path['confidence'],
-            'path_length': top_path['length'],
-            'hidden_connections': top_path.get('hidden_connections', 0)
-        }
-        
         # Run Discovery Agent
-        agent_insights = run_discovery_agent(question, path_data)
+        agent_insights = run_discovery_agent(question, search['path_data'])
         
         yield f"data: {json.dumps({'step': 'generating_insights', 'message': '💡 Generating clinical insights...', 'progress': 80})}\n\n"
         time.sleep(0.5)
         
-        # Get drug entity and scores
-        drug_entity = next(
-            (e for e in SEED_GRAPH['entities'] if e['name'] == drug_name),
-            {}
-        )
-        scores = score_repurposing_opportunity(top_path, drug_entity)
-        mechanism = generate_mechanism_summary(top_path)
-        
         # Build final discovery result
-        discovery = {
-            'success': True,
-            'found_paths': True,
-            'drug': agent_insights.get('drug_name', drug_name),
-            'disease': agent_insights.get('disease_name', disease_name),
-            'top_path': {
-                'nodes': [n['name'] for n in top_path['node_details']],
-                'node_ids': top_path['nodes'],
-                'edges': top_path['edges'],
-                'edge_details': top_path['edge_details'],
-                'mechanism': mechanism,
-                'confidence': top_path['confidence'],
-                'path_length': top_path['length'],
-                'hidden_connections': top_path.get('hidden_connections', 0)
-            },
-            'scores': scores,
-            'alternative_paths': len(paths),
-            
-            # Agent-generated insights
-            'hypothesis': agent_insights.get('hypothesis'),
-            'clinical_significance': agent_insights.get('clinical_significance'),
-            'mechanism_explanation': agent_insights.get('mechanism_explanation'),
-            'safety_rationale': agent_insights.get('safety_rationale'),
-            'knowledge_fragmentation': agent_insights.get('knowledge_fragmentation'),
-            'confidence_assessment': agent_insights.get('confidence_assessment'),
-            'hidden_knowledge_insight': agent_insights.get('hidden_knowledge_insight'),
-            'key_risks': agent_insights.get('key_risks'),
-            'next_steps': agent_insights.get('next_steps', []),
-            
-            # Legacy summary fields
-            'mechanism_summary': f"Through {top_path['length']}-step pathway involving " +
-                               " → ".join([n['name'] for n in top_path['node_details'][1:-1]]),
-            'key_insight': f"Discovery bridges {top_path.get('hidden_connections', 0)} hidden cross-domain connections"
-        }
+        discovery = build_discovery_result(drug_name, disease_name, search, agent_insights)
         
         # Final result
         yield f"data: {json.dumps({'step': 'complete', 'message': '✅ Discovery complete!', 'progress': 100, 'result': discovery})}\n\n"
@@ -285,12 +424,21 @@ def discover_stream():
     """
     data = request.get_json()
     question = data.get('question', '')
+    max_paths = parse_max_paths(data)
     
     if not question:
         return jsonify({'success': False, 'error': 'No question provided'}), 400
     
+    if max_paths is None:
+        return jsonify({'success': False, 'error': 'max_paths must be a non-negative integer'}), 400
+    
+    # Errors inside the stream can't change the status code, so report an
+    # unavailable graph or Claude client as 503 up front
+    get_graph_index()
+    LLM.get(SUBSYSTEM_WAIT_SECONDS)
+    
     return Response(
-        stream_with_context(generate_discovery_stream(question)),
+        stream_with_context(generate_discovery_stream(question, max_paths)),
         mimetype='text/event-stream',
         headers={
             'Cache-Control': 'no-cache',
@@ -307,6 +455,7 @@ def discover():
     try:
         data = request.get_json()
         question = data.get('question', '')
+        max_paths = parse_max_paths(data)
         
         if not question:
             return jsonify({
@@ -314,8 +463,17 @@ def discover():
                 'error': 'No question provided'
             }), 400
         
+        if max_paths is None:
+            return jsonify({
+                'success': False,
+                'error': 'max_paths must be a non-negative integer'
+            }), 400
+        
         print(f"🔍 Discovery question: {question}")
         
+        # The agent needs the Claude client; fail with 503 before searching
+        LLM.get(SUBSYSTEM_WAIT_SECONDS)
+        
         # Hardcoded entities for demo
         drug_name = "Semaglutide"
         disease_name = "Obesity"
@@ -323,86 +481,37 @@ def discover():
         print(f"🎯 Searching: {drug_name} → {disease_name}")
         
         # Find paths using BFS
-        paths = bfs_find_paths(
-            SEED_GRAPH,
-            start_entity=drug_name,
-            target_entity=disease_name,
-            max_depth=10
+        search = search_hypothesis(
+            get_seed_graph(),
+            drug_name,
+            disease_name,
+            max_depth=10,
+            max_paths=max_paths,
+            graph_index=get_graph_index()
         )
         
-        if not paths:
+        if not search:
             return jsonify({
                 'success': True,
                 'found_paths': False,
                 'message': f'No paths found between {drug_name} and {disease_name}'
             })
         
-        # Get top path
-        top_path = paths[0]
-        
-        # Prepare path data for agent
-        path_data = {
-            'nodes': [n['name'] for n in top_path['node_details']],
-            'node_types': [n['type'] for n in top_path['node_details']],
-            'edges': top_path['edges'],
-            'edge_details': top_path['edge_details'],
-            'confidence': top_path['confidence'],
-            'path_length': top_path['length'],
-            'hidden_connections': top_path.get('hidden_connections', 0)
-        }
-        
         # Run Discovery Agent
-        agent_insights = run_discovery_agent(question, path_data)
-        
-        # Get drug entity and scores
-        drug_entity = next(
-            (e for e in SEED_GRAPH['entities'] if e['name'] == drug_name),
-            {}
-        )
-        scores = score_repurposing_opportunity(top_path, drug_entity)
-        mechanism = generate_mechanism_summary(top_path)
+        agent_insights = run_discovery_agent(question, search['path_data'])
         
         # Build discovery result
-        discovery = {
-            'success': True,
-            'found_paths': True,
-            'drug': agent_insights.get('drug_name', drug_name),
-            'disease': agent_insights.get('disease_name', disease_name),
-            'top_path': {
-                'nodes': [n['name'] for n in top_path['node_details']],
-                'node_ids': top_path['nodes'],
-                'edges': top_path['edges'],
-                'edge_details': top_path['edge_details'],
-                'mechanism': mechanism,
-                'confidence': top_path['confidence'],
-                'path_length': top_path['length'],
-                'hidden_connections': top_path.get('hidden_connections', 0)
-            },
-            'scores': scores,
-            'alternative_paths': len(paths),
-            
-            # Agent-generated insights
-            'hypothesis': agent_insights.get('hypothesis'),
-            'clinical_significance': agent_insights.get('clinical_significance'),
-            'mechanism_explanation': agent_insights.get('mechanism_explanation'),
-            'safety_rationale': agent_insights.get('safety_rationale'),
-            'knowledge_fragmentation': agent_insights.get('knowledge_fragmentation'),
-            'confidence_assessment': agent_insights.get('confidence_assessment'),
-            'hidden_knowledge_insight': agent_insights.get('hidden_knowledge_insight'),
-            'key_risks': agent_insights.get('key_risks'),
-            'next_steps': agent_insights.get('next_steps', []),
-            
-            # Legacy summary fields
-            'mechanism_summary': f"Through {top_path['length']}-step pathway involving " +
-                               " → ".join([n['name'] for n in top_path['node_details'][1:-1]]),
-            'key_insight': f"Discovery bridges {top_path.get('hidden_connections', 0)} hidden cross-domain connections"
-        }
+        discovery = build_discovery_result(drug_name, disease_name, search, agent_insights)
         
-        print(f"✓ Discovery complete: {len(paths)} paths found")
+        top_path = search['top_path']
+        print(f"✓ Discovery complete: {search['path_count']} paths found")
         print(f"  Top path: {top_path['length']} hops, {top_path['confidence']:.0%} confidence")
         
         return jsonify(discovery)
     
+    except SubsystemUnavailable:
+        # Reported as 503 by subsystem_unavailable
+        raise
     except Exception as e:
         print(f"❌ Discovery error: {e}")
         import traceback
@@ -413,6 +522,123 @@ def discover():
         }), 500
 
 
+@app.route('/api/jobs', methods=['POST'])
+def submit_job():
+    """
+    Submit a batch of drug → disease hypotheses for background discovery
+    
+    Body: {'hypotheses': [{'drug', 'disease', 'question'?}, ...],
+           'use_agent': true, 'max_paths': 0}
+    """
+    data = request.get_json(silent=True) or {}
+    hypotheses = data.get('hypotheses') or []
+    
+    if not isinstance(hypotheses, list) or not hypotheses:
+        return jsonify({'success': False, 'error': 'No hypotheses provided'}), 400
+    
+    if len(hypotheses) > MAX_JOB_HYPOTHESES:
+        return jsonify({
+            'success': False,
+            'error': f'Too many hypotheses ({len(hypotheses)}), limit is {MAX_JOB_HYPOTHESES}'
+        }), 400
+    
+    normalized = []
+    for idx, hypothesis in enumerate(hypotheses):
+        if not isinstance(hypothesis, dict) or not hypothesis.get('drug') or not hypothesis.get('disease'):
+            return jsonify({
+                'success': False,
+                'error': f'Hypothesis {idx} needs a drug and a disease'
+            }), 400
+        normalized.append({
+            'drug': hypothesis['drug'],
+            'disease': hypothesis['disease'],
+            'question': hypothesis.get('question') or
+                        f"Can {hypothesis['drug']} be repurposed for {hypothesis['disease']}?"
+        })
+    
+    max_paths = parse_max_paths(data)
+    if max_paths is None:
+        return jsonify({'success': False, 'error': 'max_paths must be a non-negative integer'}), 400
+    
+    options = {
+        'use_agent': bool(data.get('use_agent', True)),
+        'max_paths': max_paths
+    }
+    
+    manager = get_job_manager()
+    job_id = manager.submit(normalized, options)
+    
+    return jsonify({'success': True, **manager.store.get_job(job_id)}), 202
+
+
+@app.route('/api/jobs', methods=['GET'])
+def list_jobs():
+    """List recent batch jobs"""
+    limit = request.args.get('limit', 50, type=int)
+    return jsonify({'success': True, 'jobs': get_job_manager().store.list_jobs(limit)})
+
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Batch job status and progress"""
+    job = get_job_manager().store.get_job(job_id)
+    
+    if job is None:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    
+    return jsonify({'success': True, **job})
+
+
+@app.route('/api/jobs/<job_id>/results', methods=['GET'])
+def get_job_results(job_id):
+    """Per-hypothesis results of a batch job (partial while running)"""
+    store = get_job_manager().store
+    job = store.get_job(job_id)
+    
+    if job is None:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    
+    return jsonify({'success': True, **job, 'results': store.get_results(job_id)})
+
+
+@app.route('/api/jobs/<job_id>/stream', methods=['GET'])
+def stream_job(job_id):
+    """
+    Stream batch job progress using Server-Sent Events until it completes
+    """
+    store = get_job_manager().store
+    
+    if store.get_job(job_id) is None:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    
+    def generate():
+        last = None
+        last_change = time.time()
+        while True:
+            job = store.get_job(job_id)
+            if job != last:
+                yield f"data: {json.dumps(job)}\n\n"
+                last = job
+                last_change = time.time()
+            if job['status'] == 'completed':
+                return
+            
+            # Give up on jobs that stop making progress; clients can poll or reconnect
+            if time.time() - last_change > JOB_STREAM_IDLE_SECONDS:
+                yield f"data: {json.dumps({**job, 'stream_timeout': True})}\n\n"
+                return
+            time.sleep(1)
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+
 # Serve React frontend
 @app.route('/', defaults={'path': ''})
 @app.route('/<path:path>')
@@ -425,5 +651,6 @@ def serve_frontend(path):
 
 
 if __name__ == '__main__':
+    start_background_init(include_jobs=True)
     port = int(os.environ.get('CDSW_APP_PORT', 8080))
     app.run(host='127.0.0.1', port=port, debug=False, threaded=True)
@@ -0,0 +1,122 @@
+"""
+Discovery pipeline shared by the HTTP endpoints and batch jobs
+"""
+from typing import Dict, Any, Optional
+
+from tools.graph_tools import bfs_find_path_set, generate_mechanism_summary, score_repurposing_opportunity
+
+
+def search_hypothesis(
+    graph_data: Dict[str, Any],
+    drug_name: str,
+    disease_name: str,
+    max_depth: int = 10,
+    max_paths: int = 0,
+    graph_index: Optional[Dict[str, Any]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Run the graph part of a discovery (no LLM calls)
+
+    Args:
+        graph_data: Dictionary with 'entities' and 'relationships'
+        drug_name: Drug entity name (e.g., "Semaglutide")
+        disease_name: Disease entity name (e.g., "Obesity")
+        max_depth: Maximum path length to search
+        max_paths: Include this many top paths in PathSet wire format (0 = none)
+        graph_index: Prebuilt `build_graph_index` output (built if omitted)
+
+    Returns:
+        Plain-dict search summary (safe to pickle/JSON encode), or None if
+        no paths were found
+    """
+    paths = bfs_find_path_set(
+        graph_data,
+        start_entity=drug_name,
+        target_entity=disease_name,
+        max_depth=max_depth,
+        graph_index=graph_index
+    )
+
+    if not paths:
+        return None
+
+    top_path = paths[0]
+
+    # Get drug entity and scores
+    drug_entity = next(
+        (e for e in graph_data['entities'] if e['name'] == drug_name),
+        {}
+    )
+
+    return {
+        'top_path': top_path,
+        'path_count': len(paths),
+        'path_data': prepare_path_data(top_path),
+        'scores': score_repurposing_opportunity(top_path, drug_entity),
+        'mechanism': generate_mechanism_summary(top_path),
+        'paths': paths.to_wire(max_paths) if max_paths else None
+    }
+
+
+def prepare_path_data(top_path: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Path summary passed to the discovery agent
+    """
+    return {
+        'nodes': [n['name'] for n in top_path['node_details']],
+        'node_types': [n['type'] for n in top_path['node_details']],
+        'edges': top_path['edges'],
+        'edge_details': top_path['edge_details'],
+        'confidence': top_path['confidence'],
+        'path_length': top_path['length'],
+        'hidden_connections': top_path.get('hidden_connections', 0)
+    }
+
+
+def build_discovery_result(
+    drug_name: str,
+    disease_name: str,
+    search: Dict[str, Any],
+    agent_insights: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Combine a `search_hypothesis` result and agent insights into the
+    discovery response returned by the API
+    """
+    top_path = search['top_path']
+
+    return {
+        'success': True,
+        'found_paths': True,
+        'drug': agent_insights.get('drug_name', drug_name),
+        'disease': agent_insights.get('disease_name', disease_name),
+        'top_path': {
+            'nodes': [n['name'] for n in top_path['node_details']],
+            'node_ids': top_path['nodes'],
+            'edges': top_path['edges'],
+            'edge_details': top_path['edge_details'],
+            'mechanism': search['mechanism'],
+            'confidence': top_path['confidence'],
+            'path_length': top_path['length'],
+            'hidden_connections': top_path.get('hidden_connections', 0)
+        },
+        'scores': search['scores'],
+        'alternative_paths': search['path_count'],
+        'paths': search['paths'],
+
+        # Agent-generated insights
+        'hypothesis': agent_insights.get('hypothesis'),
+        'clinical_significance': agent_insights.get('clinical_significance'),
+        'mechanism_explanation': agent_insights.get('mechanism_explanation'),
+        'safety_rationale': agent_insights.get('safety_rationale'),
+        'knowledge_fragmentation': agent_insights.get('knowledge_fragmentation'),
+        'confidence_assessment': agent_insights.get('confidence_assessment'),
+        'hidden_knowledge_insight': agent_insights.get('hidden_knowledge_insight'),
+        'key_risks': agent_insights.get('key_risks'),
+        'next_steps': agent_insights.get('next_steps', []),
+
+        # Legacy summary fields
+        'mechanism_summary': f"Through {top_path['length']}-step pathway involving " +
+                           " → ".join([n['name'] for n in top_path['node_details'][1:-1]]),
+        'key_insight': f"Discovery bridges {top_path.get('hidden_connections', 0)} hidden cross-domain connections"
+    }
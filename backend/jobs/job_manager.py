@@ -0,0 +1,231 @@
+"""
+Batch discovery job runner
+
+Graph searches run in a process pool (CPU-bound, scales with cores) and
+LLM calls run in a separate, smaller thread pool so the Claude API is
+throttled independently of search throughput.
+"""
+import json
+import multiprocessing
+import os
+import threading
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Dict, Any, Optional
+
+from discovery import search_hypothesis, build_discovery_result
+from jobs.job_store import JobStore
+from tools.graph_tools import build_graph_index
+
+# Times an item is retried when its search worker process dies
+MAX_SEARCH_ATTEMPTS = 3
+
+# Per-process graph and store, loaded once by the search worker initializer
+_WORKER_GRAPH: Optional[Dict[str, Any]] = None
+_WORKER_GRAPH_INDEX: Optional[Dict[str, Any]] = None
+_WORKER_STORE: Optional[JobStore] = None
+
+
+def _init_search_worker(graph_path: str, db_path: str) -> None:
+    global _WORKER_GRAPH, _WORKER_GRAPH_INDEX, _WORKER_STORE
+
+    with open(graph_path, 'r') as f:
+        _WORKER_GRAPH = json.load(f)
+    _WORKER_GRAPH_INDEX = build_graph_index(_WORKER_GRAPH)
+    _WORKER_STORE = JobStore(db_path)
+
+
+def _run_search(
+    job_id: str,
+    idx: int,
+    drug: str,
+    disease: str,
+    max_depth: int,
+    max_paths: int
+) -> Optional[Dict[str, Any]]:
+    # Marked here so 'queued' means "waiting for a worker"
+    _WORKER_STORE.set_status(job_id, idx, 'searching')
+
+    return search_hypothesis(
+        _WORKER_GRAPH,
+        drug,
+        disease,
+        max_depth=max_depth,
+        max_paths=max_paths,
+        graph_index=_WORKER_GRAPH_INDEX
+    )
+
+
+class JobManager:
+    """
+    Runs batch jobs on bounded worker pools and records results in a JobStore
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        graph_path: str,
+        search_workers: Optional[int] = None,
+        llm_concurrency: int = 4,
+        max_depth: int = 10
+    ):
+        self.store = store
+        self.graph_path = graph_path
+        self.search_workers = search_workers or os.cpu_count() or 1
+        self.max_depth = max_depth
+
+        self._search_pool = self._new_search_pool()
+        self._search_pool_lock = threading.Lock()
+        self._attempts: Dict[tuple, int] = {}
+        self._attempts_lock = threading.Lock()
+
+        self._llm_pool = ThreadPoolExecutor(
+            max_workers=llm_concurrency,
+            thread_name_prefix='discovery-llm'
+        )
+
+    def submit(self, hypotheses: List[Dict[str, str]], options: Dict[str, Any]) -> str:
+        """
+        Queue a batch of hypotheses
+
+        Args:
+            hypotheses: List of {'drug', 'disease', 'question'} dicts
+            options: {'use_agent': bool, 'max_paths': int}
+
+        Returns:
+            Job ID
+        """
+        job_id = self.store.create_job(hypotheses, options)
+        for idx, hypothesis in enumerate(hypotheses):
+            self._schedule(job_id, idx, hypothesis, options)
+
+        print(f"📋 Job {job_id} queued: {len(hypotheses)} hypotheses")
+        return job_id
+
+    def resume(self) -> int:
+        """Re-queue items left unfinished by a previous run"""
+        self.store.requeue_pending()
+        pending = self.store.pending_items()
+        for item in pending:
+            self._schedule(item['job_id'], item['index'], item['hypothesis'], item['options'])
+
+        if pending:
+            print(f"📋 Resumed {len(pending)} unfinished job items")
+        return len(pending)
+
+    def shutdown(self) -> None:
+        self._search_pool.shutdown(wait=False, cancel_futures=True)
+        self._llm_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _new_search_pool(self) -> ProcessPoolExecutor:
+        # Spawned (not forked) workers: the Flask server is multi-threaded
+        return ProcessPoolExecutor(
+            max_workers=self.search_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_search_worker,
+            initargs=(self.graph_path, self.store.db_path)
+        )
+
+    def _replace_broken_pool(self, broken: ProcessPoolExecutor) -> None:
+        # Several callbacks see the same broken pool; only the first replaces it
+        with self._search_pool_lock:
+            if self._search_pool is broken:
+                print("⚠️  Search worker died, restarting search pool")
+                broken.shutdown(wait=False, cancel_futures=True)
+                self._search_pool = self._new_search_pool()
+
+    def _schedule(self, job_id: str, idx: int, hypothesis: Dict[str, str], options: Dict[str, Any]) -> None:
+        for _ in range(2):
+            pool = self._search_pool
+            try:
+                future = pool.submit(
+                    _run_search,
+                    job_id,
+                    idx,
+                    hypothesis['drug'],
+                    hypothesis['disease'],
+                    self.max_depth,
+                    options.get('max_paths', 0)
+                )
+                break
+            except BrokenProcessPool:
+                self._replace_broken_pool(pool)
+        else:
+            self.store.fail_item(job_id, idx, 'Search worker pool unavailable')
+            return
+
+        future.add_done_callback(
+            lambda f: self._on_search_done(job_id, idx, hypothesis, options, pool, f)
+        )
+
+    def _clear_attempts(self, key: tuple) -> None:
+        with self._attempts_lock:
+            self._attempts.pop(key, None)
+
+    def _on_search_done(
+        self,
+        job_id: str,
+        idx: int,
+        hypothesis: Dict[str, str],
+        options: Dict[str, Any],
+        pool: ProcessPoolExecutor,
+        future: Future
+    ) -> None:
+        key = (job_id, idx)
+        try:
+            search = future.result()
+        except CancelledError:
+            # Manager shutting down; the item stays pending and is resumed on restart
+            return
+        except BrokenProcessPool:
+            # A worker died (OOM, crash); every in-flight search fails with it
+            self._replace_broken_pool(pool)
+            with self._attempts_lock:
+                attempts = self._attempts[key] = self._attempts.get(key, 0) + 1
+            if attempts < MAX_SEARCH_ATTEMPTS:
+                self.store.set_status(job_id, idx, 'queued')
+                self._schedule(job_id, idx, hypothesis, options)
+            else:
+                self._clear_attempts(key)
+                print(f"❌ Job {job_id} item {idx}: search worker crashed {attempts} times")
+                self.store.fail_item(job_id, idx, 'Search worker crashed')
+            return
+        except Exception as e:
+            self._clear_attempts(key)
+            print(f"❌ Job {job_id} item {idx} search error: {e}")
+            self.store.fail_item(job_id, idx, str(e))
+            return
+
+        self._clear_attempts(key)
+
+        if not search:
+            self.store.complete_item(job_id, idx, {
+                'success': True,
+                'found_paths': False,
+                'message': f"No paths found between {hypothesis['drug']} and {hypothesis['disease']}"
+            })
+            return
+
+        if not options.get('use_agent', True):
+            self.store.complete_item(
+                job_id, idx,
+                build_discovery_result(hypothesis['drug'], hypothesis['disease'], search, {})
+            )
+            return
+
+        self.store.set_status(job_id, idx, 'analyzing')
+        self._llm_pool.submit(self._run_agent, job_id, idx, hypothesis, search)
+
+    def _run_agent(self, job_id: str, idx: int, hypothesis: Dict[str, str], search: Dict[str, Any]) -> None:
+        try:
+            # Imported here so graph-only jobs work without ANTHROPIC_API_KEY
+            from agents.discovery_agent import run_discovery_agent
+
+            agent_insights = run_discovery_agent(hypothesis['question'], search['path_data'])
+            self.store.complete_item(
+                job_id, idx,
+                build_discovery_result(hypothesis['drug'], hypothesis['disease'], search, agent_insights)
+            )
+        except Exception as e:
+            print(f"❌ Job {job_id} item {idx} agent error: {e}")
+            self.store.fail_item(job_id, idx, str(e))
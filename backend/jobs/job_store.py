@@ -0,0 +1,205 @@
+"""
+SQLite-backed store for batch discovery jobs
+"""
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Iterator
+
+# Item statuses that still need work (re-queued after a restart)
+PENDING_STATUSES = ('queued', 'searching', 'analyzing')
+
+
+class JobStore:
+    """
+    Persists jobs and per-hypothesis results to a local SQLite file so
+    they survive application restarts
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        with self._connect() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    created_at REAL NOT NULL,
+                    options TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS job_items (
+                    job_id TEXT NOT NULL,
+                    idx INTEGER NOT NULL,
+                    drug TEXT NOT NULL,
+                    disease TEXT NOT NULL,
+                    question TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (job_id, idx)
+                );
+            """)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per operation; commits on success
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def create_job(self, hypotheses: List[Dict[str, str]], options: Dict[str, Any]) -> str:
+        """Save a new job with all its hypotheses queued and return its ID"""
+        job_id = uuid.uuid4().hex
+        now = time.time()
+
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, created_at, options) VALUES (?, ?, ?)",
+                (job_id, now, json.dumps(options))
+            )
+            conn.executemany(
+                "INSERT INTO job_items (job_id, idx, drug, disease, question, status, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, 'queued', ?)",
+                [
+                    (job_id, idx, h['drug'], h['disease'], h['question'], now)
+                    for idx, h in enumerate(hypotheses)
+                ]
+            )
+        return job_id
+
+    def set_status(self, job_id: str, idx: int, status: str) -> None:
+        self._update(job_id, idx, status)
+
+    def complete_item(self, job_id: str, idx: int, result: Dict[str, Any]) -> None:
+        self._update(job_id, idx, 'completed', result=json.dumps(result))
+
+    def fail_item(self, job_id: str, idx: int, error: str) -> None:
+        self._update(job_id, idx, 'failed', error=error)
+
+    def _update(
+        self,
+        job_id: str,
+        idx: int,
+        status: str,
+        result: Optional[str] = None,
+        error: Optional[str] = None
+    ) -> None:
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "UPDATE job_items SET status = ?, result = ?, error = ?, updated_at = ? "
+                "WHERE job_id = ? AND idx = ?",
+                (status, result, error, time.time(), job_id, idx)
+            )
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Job summary with per-status item counts, or None if unknown"""
+        with self._connect() as conn:
+            job = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if job is None:
+                return None
+            counts = conn.execute(
+                "SELECT status, COUNT(*) AS n FROM job_items WHERE job_id = ? GROUP BY status",
+                (job_id,)
+            ).fetchall()
+        return self._summarize(job, {row['status']: row['n'] for row in counts})
+
+    def list_jobs(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Most recent job summaries first"""
+        with self._connect() as conn:
+            jobs = conn.execute(
+                "SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+            counts = conn.execute(
+                "SELECT job_id, status, COUNT(*) AS n FROM job_items GROUP BY job_id, status"
+            ).fetchall()
+
+        by_job: Dict[str, Dict[str, int]] = {}
+        for row in counts:
+            by_job.setdefault(row['job_id'], {})[row['status']] = row['n']
+        return [self._summarize(job, by_job.get(job['id'], {})) for job in jobs]
+
+    def get_results(self, job_id: str) -> List[Dict[str, Any]]:
+        """All items of a job in submission order"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM job_items WHERE job_id = ? ORDER BY idx", (job_id,)
+            ).fetchall()
+        return [
+            {
+                'index': row['idx'],
+                'drug': row['drug'],
+                'disease': row['disease'],
+                'question': row['question'],
+                'status': row['status'],
+                'result': json.loads(row['result']) if row['result'] else None,
+                'error': row['error']
+            }
+            for row in rows
+        ]
+
+    def requeue_pending(self) -> None:
+        """Reset unfinished items to 'queued' (one bulk update, used on restart)"""
+        placeholders = ', '.join('?' for _ in PENDING_STATUSES)
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                f"UPDATE job_items SET status = 'queued', updated_at = ? WHERE status IN ({placeholders})",
+                (time.time(), *PENDING_STATUSES)
+            )
+
+    def pending_items(self) -> List[Dict[str, Any]]:
+        """Items left unfinished (e.g. by a restart), with their job options"""
+        placeholders = ', '.join('?' for _ in PENDING_STATUSES)
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT i.job_id, i.idx, i.drug, i.disease, i.question, j.options "
+                "FROM job_items i JOIN jobs j ON j.id = i.job_id "
+                f"WHERE i.status IN ({placeholders}) ORDER BY j.created_at, i.idx",
+                PENDING_STATUSES
+            ).fetchall()
+        return [
+            {
+                'job_id': row['job_id'],
+                'index': row['idx'],
+                'hypothesis': {
+                    'drug': row['drug'],
+                    'disease': row['disease'],
+                    'question': row['question']
+                },
+                'options': json.loads(row['options'])
+            }
+            for row in rows
+        ]
+
+    @staticmethod
+    def _summarize(job: sqlite3.Row, counts: Dict[str, int]) -> Dict[str, Any]:
+        total = sum(counts.values())
+        completed = counts.get('completed', 0)
+        failed = counts.get('failed', 0)
+        pending = total - completed - failed
+
+        if pending == 0:
+            status = 'completed'
+        elif counts.get('queued', 0) == total:
+            status = 'queued'
+        else:
+            status = 'running'
+
+        return {
+            'job_id': job['id'],
+            'status': status,
+            'created_at': job['created_at'],
+            'options': json.loads(job['options']),
+            'total': total,
+            'completed': completed,
+            'failed': failed,
+            'pending': pending,
+            'progress': int(100 * (completed + failed) / total) if total else 100
+        }
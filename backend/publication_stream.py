@@ -0,0 +1,383 @@
+"""
+Streaming ingestion of publication uploads
+
+The request body is read in chunks and parsed incrementally (multipart or
+raw text). Text is decoded as it arrives, cut into extraction-sized chunks
+and sent to triplet extraction on a small thread pool while the rest of
+the upload is still being read. Zip/tar archives are spooled to a
+temporary file and their text members go through the same pipeline.
+"""
+import codecs
+import tarfile
+import tempfile
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Any, IO, Iterable, Iterator, List, Optional
+
+from werkzeug.sansio.multipart import Data, Epilogue, Field, File, MultipartDecoder, NeedData
+
+READ_CHUNK_SIZE = 64 * 1024
+EXTRACTION_CHUNK_CHARS = 20000
+TEXT_EXTENSIONS = ('.txt', '.md')
+ARCHIVE_EXTENSIONS = ('.zip', '.tar', '.tar.gz', '.tgz')
+
+# Per-archive limits, guarding against decompression bombs
+MAX_ARCHIVE_MEMBERS = 1000
+MAX_ARCHIVE_BYTES = 200 * 1024 * 1024
+
+
+class TextChunker:
+    """
+    Buffers decoded text and cuts it into chunks of at most `max_chars`,
+    preferring paragraph then line boundaries
+    """
+
+    def __init__(self, max_chars: int = EXTRACTION_CHUNK_CHARS):
+        self.max_chars = max_chars
+        self._buffer = ''
+
+    def feed(self, text: str) -> List[str]:
+        self._buffer += text
+        chunks = []
+        while len(self._buffer) > self.max_chars:
+            window = self._buffer[:self.max_chars]
+            cut = window.rfind('\n\n')
+            if cut <= 0:
+                cut = window.rfind('\n')
+            if cut <= 0:
+                cut = self.max_chars
+            chunks.append(self._buffer[:cut])
+            self._buffer = self._buffer[cut:].lstrip('\n')
+        return chunks
+
+    def flush(self) -> List[str]:
+        remainder, self._buffer = self._buffer, ''
+        return [remainder] if remainder.strip() else []
+
+
+class _TextFile:
+    """Per-file decoding and extraction state"""
+
+    def __init__(self, filename: str, max_chars: int):
+        self.filename = filename
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.chunker = TextChunker(max_chars)
+        self.characters = 0
+        self.chunks_submitted = 0
+        self.chunks_pending = 0
+        self.triplet_count = 0
+        self.reading = True
+        self.failed = False
+
+
+class PublicationIngest:
+    """
+    Pipeline from an uploaded request body to triplet extraction events
+
+    Events are plain dicts with a 'step' key, in the same spirit as the
+    discovery stream:
+        file_started, progress, triplets, file_complete, file_skipped,
+        file_error, complete
+    """
+
+    def __init__(
+        self,
+        extract_triplets: Callable[[str], list],
+        llm_workers: int = 2,
+        max_chars: int = EXTRACTION_CHUNK_CHARS
+    ):
+        self.extract_triplets = extract_triplets
+        self.llm_workers = llm_workers
+        self.max_chars = max_chars
+
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._futures: Dict[Future, tuple] = {}
+        self._events: List[Dict[str, Any]] = []
+        self._files: List[_TextFile] = []
+        self._archives: List[_Archive] = []
+        self._bytes_received = 0
+        self._content_length: Optional[int] = None
+
+    # ------------------------------------------------------------------
+    # Entry points
+    # ------------------------------------------------------------------
+
+    def ingest_multipart(
+        self,
+        body_chunks: Iterable[bytes],
+        boundary: bytes,
+        content_length: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Process a multipart/form-data body; every file part is ingested"""
+        decoder = MultipartDecoder(boundary)
+        current = None
+
+        def handle_events() -> None:
+            nonlocal current
+            event = decoder.next_event()
+            while not isinstance(event, (NeedData, Epilogue)):
+                if isinstance(event, File):
+                    current = self._open(event.filename or event.name)
+                elif isinstance(event, Field):
+                    current = None
+                elif isinstance(event, Data) and current is not None:
+                    self._feed(current, event.data)
+                    if not event.more_data:
+                        self._close(current)
+                        current = None
+                event = decoder.next_event()
+
+        return self._run(body_chunks, content_length, decoder.receive_data, handle_events)
+
+    def ingest_raw(
+        self,
+        body_chunks: Iterable[bytes],
+        filename: str,
+        content_length: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Process a body that is a single file (text or archive)"""
+        current = None
+
+        def receive(data: Optional[bytes]) -> None:
+            nonlocal current
+            if current is None:
+                current = self._open(filename)
+            if data is None:
+                self._close(current)
+            else:
+                self._feed(current, data)
+
+        return self._run(body_chunks, content_length, receive, lambda: None)
+
+    # ------------------------------------------------------------------
+    # Pipeline
+    # ------------------------------------------------------------------
+
+    def _run(
+        self,
+        body_chunks: Iterable[bytes],
+        content_length: Optional[int],
+        receive: Callable[[Optional[bytes]], None],
+        handle_events: Callable[[], None]
+    ) -> Iterator[Dict[str, Any]]:
+        self._content_length = content_length
+        self._pool = ThreadPoolExecutor(max_workers=self.llm_workers, thread_name_prefix='ingest-llm')
+
+        try:
+            for chunk in body_chunks:
+                self._bytes_received += len(chunk)
+                receive(chunk)
+                handle_events()
+                self._emit_progress()
+                yield from self._drain(block=False)
+                yield from self._expand_archives()
+                yield from self._backpressure()
+
+            receive(None)
+            handle_events()
+            yield from self._expand_archives()
+
+            while self._futures:
+                yield from self._drain(block=True)
+            yield from self._take_events()
+
+            yield {
+                'step': 'complete',
+                'message': f'✅ Processed {len(self._files)} file(s)',
+                'progress': 100,
+                'files': [
+                    {
+                        'filename': f.filename,
+                        'characters': f.characters,
+                        'triplet_count': f.triplet_count,
+                        'success': not f.failed
+                    }
+                    for f in self._files
+                ],
+                'triplet_count': sum(f.triplet_count for f in self._files)
+            }
+        finally:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _open(self, filename: str):
+        self._events.append({'step': 'file_started', 'filename': filename})
+
+        if filename.lower().endswith(ARCHIVE_EXTENSIONS):
+            return _Archive(filename)
+
+        text_file = _TextFile(filename, self.max_chars)
+        self._files.append(text_file)
+        return text_file
+
+    def _feed(self, target, data: bytes) -> None:
+        if isinstance(target, _Archive):
+            target.spool.write(data)
+            return
+
+        if target.failed:
+            return
+        try:
+            text = target.decoder.decode(data)
+        except UnicodeDecodeError as e:
+            self._fail(target, f'Not valid UTF-8 text: {e}')
+            return
+        target.characters += len(text)
+        for chunk in target.chunker.feed(text):
+            self._submit(target, chunk)
+
+    def _close(self, target) -> None:
+        if isinstance(target, _Archive):
+            # Expanded from _run so extraction backpressure applies to members
+            self._archives.append(target)
+            return
+
+        if not target.failed:
+            try:
+                target.characters += len(target.decoder.decode(b'', final=True))
+            except UnicodeDecodeError as e:
+                self._fail(target, f'Not valid UTF-8 text: {e}')
+                return
+            for chunk in target.chunker.flush():
+                self._submit(target, chunk)
+
+        target.reading = False
+        self._maybe_complete(target)
+
+    def _backpressure(self) -> Iterator[Dict[str, Any]]:
+        # Stop reading while extraction is behind
+        while len(self._futures) >= self.llm_workers * 2:
+            yield from self._drain(block=True)
+
+    def _expand_archives(self) -> Iterator[Dict[str, Any]]:
+        while self._archives:
+            yield from self._expand_archive(self._archives.pop(0))
+
+    def _expand_archive(self, archive: '_Archive') -> Iterator[Dict[str, Any]]:
+        members = 0
+        expanded_bytes = 0
+        try:
+            for member_name, member in archive.members():
+                if not member_name.lower().endswith(TEXT_EXTENSIONS):
+                    self._events.append({
+                        'step': 'file_skipped',
+                        'filename': f'{archive.filename}/{member_name}',
+                        'message': 'Only text files are extracted from archives'
+                    })
+                    continue
+
+                members += 1
+                if members > MAX_ARCHIVE_MEMBERS:
+                    raise _ArchiveLimitExceeded(f'more than {MAX_ARCHIVE_MEMBERS} text files')
+
+                text_file = self._open(f'{archive.filename}/{member_name}')
+                with member:
+                    for data in iter(lambda: member.read(READ_CHUNK_SIZE), b''):
+                        expanded_bytes += len(data)
+                        if expanded_bytes > MAX_ARCHIVE_BYTES:
+                            self._fail(text_file, 'Archive size limit exceeded')
+                            raise _ArchiveLimitExceeded(
+                                f'more than {MAX_ARCHIVE_BYTES // (1024 * 1024)} MB of decompressed text'
+                            )
+                        self._feed(text_file, data)
+                        yield from self._drain(block=False)
+                        yield from self._backpressure()
+                self._close(text_file)
+        except _ArchiveLimitExceeded as e:
+            self._events.append({
+                'step': 'file_error',
+                'filename': archive.filename,
+                'message': f'Archive too large: {e}'
+            })
+        except (zipfile.BadZipFile, tarfile.TarError) as e:
+            self._events.append({
+                'step': 'file_error',
+                'filename': archive.filename,
+                'message': f'Could not read archive: {e}'
+            })
+        finally:
+            archive.spool.close()
+        yield from self._take_events()
+
+    def _submit(self, text_file: _TextFile, text: str) -> None:
+        chunk_index = text_file.chunks_submitted
+        text_file.chunks_submitted += 1
+        text_file.chunks_pending += 1
+
+        future = self._pool.submit(self.extract_triplets, text)
+        self._futures[future] = (text_file, chunk_index)
+
+    def _drain(self, block: bool) -> Iterator[Dict[str, Any]]:
+        if self._futures:
+            done, _ = wait(list(self._futures), timeout=None if block else 0, return_when=FIRST_COMPLETED)
+            for future in done:
+                text_file, chunk_index = self._futures.pop(future)
+                text_file.chunks_pending -= 1
+                try:
+                    triplets = future.result()
+                except Exception as e:
+                    print(f"❌ Extraction error ({text_file.filename}, chunk {chunk_index}): {e}")
+                    self._fail(text_file, str(e))
+                else:
+                    text_file.triplet_count += len(triplets)
+                    self._events.append({
+                        'step': 'triplets',
+                        'filename': text_file.filename,
+                        'chunk': chunk_index,
+                        'triplets': triplets,
+                        'triplet_count': len(triplets)
+                    })
+                self._maybe_complete(text_file)
+        yield from self._take_events()
+
+    def _fail(self, text_file: _TextFile, message: str) -> None:
+        if not text_file.failed:
+            text_file.failed = True
+            self._events.append({'step': 'file_error', 'filename': text_file.filename, 'message': message})
+
+    def _maybe_complete(self, text_file: _TextFile) -> None:
+        if text_file.reading or text_file.chunks_pending or text_file.failed:
+            return
+        print(f"✓ Processed publication: {text_file.filename} ({text_file.characters} characters)")
+        self._events.append({
+            'step': 'file_complete',
+            'filename': text_file.filename,
+            'characters': text_file.characters,
+            'triplet_count': text_file.triplet_count
+        })
+
+    def _emit_progress(self) -> None:
+        event = {'step': 'progress', 'bytes_received': self._bytes_received}
+        if self._content_length:
+            event['progress'] = min(99, int(100 * self._bytes_received / self._content_length))
+        self._events.append(event)
+
+    def _take_events(self) -> Iterator[Dict[str, Any]]:
+        events, self._events = self._events, []
+        yield from events
+
+
+class _ArchiveLimitExceeded(Exception):
+    pass
+
+
+class _Archive:
+    """Archive upload spooled to memory/disk until its part is complete"""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.spool: IO[bytes] = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+
+    def members(self) -> Iterator[tuple]:
+        """Yield (name, binary file object) for each regular file member"""
+        self.spool.seek(0)
+
+        if self.filename.lower().endswith('.zip'):
+            with zipfile.ZipFile(self.spool) as archive:
+                for info in archive.infolist():
+                    if not info.is_dir():
+                        yield info.filename, archive.open(info)
+        else:
+            with tarfile.open(fileobj=self.spool, mode='r:*') as archive:
+                for info in archive:
+                    if info.isfile():
+                        yield info.name, archive.extractfile(info)
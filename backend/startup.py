@@ -0,0 +1,118 @@
+"""
+Lazy subsystem initialization, readiness reporting and startup profiling
+
+Heavy subsystems (graph, LLM client, job workers) are registered as
+`Subsystem`s that initialize on first use or in a background thread, so
+importing the app stays fast and graph-only endpoints work even when the
+LLM is unavailable. Set STARTUP_PROFILE=1 to print import and
+initialization times per component once startup finishes.
+"""
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+STARTUP_PROFILE = os.environ.get('STARTUP_PROFILE', '').lower() in ('1', 'true', 'yes')
+
+_PROCESS_START = time.perf_counter()
+
+# (component, kind, seconds) in the order they were measured
+_timings: List[tuple] = []
+_timings_lock = threading.Lock()
+
+
+@contextmanager
+def profiled(component: str, kind: str = 'import') -> Iterator[None]:
+    """Record how long the wrapped block takes under `component`"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        with _timings_lock:
+            _timings.append((component, kind, time.perf_counter() - start))
+
+
+def startup_profile() -> List[Dict[str, Any]]:
+    """Import and initialization timings recorded so far"""
+    with _timings_lock:
+        return [
+            {'component': component, 'kind': kind, 'seconds': round(seconds, 4)}
+            for component, kind, seconds in _timings
+        ]
+
+
+def print_startup_profile() -> None:
+    print("⏱️  Startup profile:")
+    for entry in startup_profile():
+        print(f"  {entry['kind']:<6} {entry['component']:<24} {entry['seconds'] * 1000:8.1f} ms")
+    print(f"  total  since process start   {(time.perf_counter() - _PROCESS_START) * 1000:8.1f} ms")
+
+
+class SubsystemUnavailable(Exception):
+    """Raised when a subsystem failed to initialize or is not configured"""
+
+
+class Subsystem:
+    """
+    A lazily initialized component with a readiness state
+
+    States: not_started → initializing → ready | failed
+    """
+
+    def __init__(self, name: str, loader: Callable[[], Any]):
+        self.name = name
+        self.loader = loader
+        self.state = 'not_started'
+        self.error: Optional[str] = None
+        self.seconds: Optional[float] = None
+
+        self._value = None
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+
+    def start(self, background: bool = True) -> None:
+        """Begin initialization (no-op if already started)"""
+        with self._lock:
+            if self.state != 'not_started':
+                return
+            self.state = 'initializing'
+
+        if background:
+            threading.Thread(target=self._load, name=f'init-{self.name}', daemon=True).start()
+        else:
+            self._load()
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """Return the initialized value, initializing now if nobody has started it"""
+        self.start(background=False)
+
+        if not self._done.wait(timeout):
+            raise SubsystemUnavailable(f"{self.name} is still initializing")
+        if self.state != 'ready':
+            raise SubsystemUnavailable(f"{self.name} unavailable: {self.error}")
+        return self._value
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            'state': self.state,
+            'seconds': round(self.seconds, 4) if self.seconds is not None else None,
+            'error': self.error
+        }
+
+    def _load(self) -> None:
+        start = time.perf_counter()
+        try:
+            with profiled(self.name, 'init'):
+                self._value = self.loader()
+            self.state = 'ready'
+        except Exception as e:
+            self.error = str(e)
+            self.state = 'failed'
+            print(f"⚠️  {self.name} failed to initialize: {e}")
+        finally:
+            self.seconds = time.perf_counter() - start
+            self._done.set()
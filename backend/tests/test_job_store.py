@@ -0,0 +1,177 @@
+"""
+JobStore persistence and status rules, and JobManager runs, retries and
+resumes against a real search worker process
+"""
+import os
+import sys
+import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from jobs.job_manager import JobManager, MAX_SEARCH_ATTEMPTS
+from jobs.job_store import JobStore
+
+SEED_GRAPH_PATH = os.path.join(os.path.dirname(BACKEND_DIR), 'data/seed_graph.json')
+
+HYPOTHESES = [
+    {'drug': 'Semaglutide', 'disease': 'Metabolic Syndrome', 'question': 'Semaglutide for metabolic syndrome?'},
+    {'drug': 'Semaglutide', 'disease': 'Unknown Disease', 'question': 'Semaglutide for an unknown disease?'},
+    {'drug': 'Metformin', 'disease': 'Metabolic Syndrome', 'question': 'Metformin for metabolic syndrome?'}
+]
+OPTIONS = {'use_agent': False, 'max_paths': 2}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JobStore(str(tmp_path / 'jobs.db'))
+
+
+@pytest.fixture
+def manager(store):
+    manager = JobManager(store, SEED_GRAPH_PATH, search_workers=1, llm_concurrency=1)
+    yield manager
+    manager.shutdown()
+
+
+def wait_for_job(store, job_id, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = store.get_job(job_id)
+        if job['status'] == 'completed':
+            return job
+        time.sleep(0.1)
+    raise AssertionError(f'Job did not finish: {store.get_job(job_id)}')
+
+
+def test_new_job_is_queued(store):
+    job_id = store.create_job(HYPOTHESES, OPTIONS)
+    job = store.get_job(job_id)
+
+    assert job['status'] == 'queued'
+    assert job['options'] == OPTIONS
+    assert (job['total'], job['pending'], job['progress']) == (3, 3, 0)
+    assert store.get_job('missing') is None
+
+
+def test_status_rules(store):
+    job_id = store.create_job(HYPOTHESES, OPTIONS)
+
+    store.set_status(job_id, 0, 'searching')
+    assert store.get_job(job_id)['status'] == 'running'
+
+    store.complete_item(job_id, 0, {'success': True})
+    store.fail_item(job_id, 1, 'boom')
+    job = store.get_job(job_id)
+    assert job['status'] == 'running'
+    assert (job['completed'], job['failed'], job['pending'], job['progress']) == (1, 1, 1, 66)
+
+    store.complete_item(job_id, 2, {'success': True})
+    job = store.get_job(job_id)
+    assert job['status'] == 'completed'
+    assert job['progress'] == 100
+
+
+def test_results_in_submission_order(store):
+    job_id = store.create_job(HYPOTHESES, OPTIONS)
+    store.complete_item(job_id, 2, {'success': True, 'score': 0.5})
+    store.fail_item(job_id, 0, 'boom')
+
+    results = store.get_results(job_id)
+    assert [r['index'] for r in results] == [0, 1, 2]
+    assert [r['status'] for r in results] == ['failed', 'queued', 'completed']
+    assert results[0]['error'] == 'boom'
+    assert results[2]['result'] == {'success': True, 'score': 0.5}
+    assert results[1]['drug'] == HYPOTHESES[1]['drug']
+
+
+def test_list_jobs_most_recent_first(store):
+    first = store.create_job(HYPOTHESES[:1], OPTIONS)
+    second = store.create_job(HYPOTHESES, OPTIONS)
+
+    assert [job['job_id'] for job in store.list_jobs()] == [second, first]
+    assert [job['job_id'] for job in store.list_jobs(limit=1)] == [second]
+
+
+def test_requeue_pending_resets_unfinished_items(store):
+    job_id = store.create_job(HYPOTHESES, OPTIONS)
+    store.set_status(job_id, 0, 'searching')
+    store.set_status(job_id, 1, 'analyzing')
+    store.complete_item(job_id, 2, {'success': True})
+
+    store.requeue_pending()
+
+    assert [r['status'] for r in store.get_results(job_id)] == ['queued', 'queued', 'completed']
+    pending = store.pending_items()
+    assert [(item['job_id'], item['index']) for item in pending] == [(job_id, 0), (job_id, 1)]
+    assert pending[0]['hypothesis'] == HYPOTHESES[0]
+    assert pending[0]['options'] == OPTIONS
+
+
+def test_manager_runs_job_to_completion(store, manager):
+    job_id = manager.submit(HYPOTHESES, OPTIONS)
+    job = wait_for_job(store, job_id)
+
+    assert (job['completed'], job['failed']) == (3, 0)
+    results = store.get_results(job_id)
+    assert results[0]['result']['found_paths'] is True
+    assert len(results[0]['result']['paths']['paths']) == 2
+    assert results[1]['result']['found_paths'] is False
+
+
+def test_manager_resumes_unfinished_items(store):
+    # Left behind by a previous run that stopped mid-job
+    job_id = store.create_job(HYPOTHESES, OPTIONS)
+    store.set_status(job_id, 0, 'searching')
+    store.complete_item(job_id, 2, {'success': True, 'kept': True})
+
+    manager = JobManager(store, SEED_GRAPH_PATH, search_workers=1, llm_concurrency=1)
+    try:
+        assert manager.resume() == 2
+        job = wait_for_job(store, job_id)
+    finally:
+        manager.shutdown()
+
+    assert (job['completed'], job['failed']) == (3, 0)
+    assert store.get_results(job_id)[2]['result'] == {'success': True, 'kept': True}
+
+
+def test_broken_pool_retries_then_fails(store, manager):
+    job_id = store.create_job(HYPOTHESES[:1], OPTIONS)
+    rescheduled = []
+    manager._schedule = lambda *args: rescheduled.append(args)
+
+    def crash():
+        future = Future()
+        future.set_exception(BrokenProcessPool('worker died'))
+        # Not the current pool, so nothing is restarted
+        manager._on_search_done(job_id, 0, HYPOTHESES[0], OPTIONS, object(), future)
+
+    for attempt in range(1, MAX_SEARCH_ATTEMPTS):
+        store.set_status(job_id, 0, 'searching')
+        crash()
+        assert len(rescheduled) == attempt
+        assert store.get_results(job_id)[0]['status'] == 'queued'
+
+    crash()
+    assert len(rescheduled) == MAX_SEARCH_ATTEMPTS - 1
+    result = store.get_results(job_id)[0]
+    assert (result['status'], result['error']) == ('failed', 'Search worker crashed')
+    assert manager._attempts == {}
+
+
+def test_broken_pool_is_replaced_and_items_complete(store, manager):
+    job_id = store.create_job(HYPOTHESES[:1], OPTIONS)
+    broken = manager._search_pool
+    future = Future()
+    future.set_exception(BrokenProcessPool('worker died'))
+
+    manager._on_search_done(job_id, 0, HYPOTHESES[0], OPTIONS, broken, future)
+
+    assert manager._search_pool is not broken
+    job = wait_for_job(store, job_id)
+    assert (job['completed'], job['failed']) == (1, 0)
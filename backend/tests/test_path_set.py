@@ -0,0 +1,143 @@
+"""
+PathSet search must match the original list-based BFS, and its wire
+format must round-trip
+"""
+import json
+import os
+import sys
+import tracemalloc
+from collections import deque
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from tools.graph_tools import bfs_find_path_set, bfs_find_paths, build_graph_index
+from tools.path_set import PathSet
+
+SEED_GRAPH_PATH = os.path.join(os.path.dirname(BACKEND_DIR), 'data/seed_graph.json')
+
+
+def reference_bfs(graph_index, start_entity, target_entity, max_depth):
+    """The list-of-dicts BFS that bfs_find_paths used before PathSet"""
+    adjacency = graph_index['adjacency']
+    relationship_map = graph_index['relationship_map']
+    entity_details = graph_index['entity_details']
+    start_id = graph_index['entity_map'].get(start_entity)
+    target_id = graph_index['entity_map'].get(target_entity)
+
+    if not start_id or not target_id:
+        return []
+
+    paths = []
+    queue = deque([([start_id], [])])
+    while queue:
+        node_path, edge_path = queue.popleft()
+        current = node_path[-1]
+        if current == target_id:
+            confidences = [relationship_map[edge]['confidence'] for edge in edge_path]
+            paths.append({
+                'nodes': node_path,
+                'edges': edge_path,
+                'length': len(node_path) - 1,
+                'confidence': sum(confidences) / len(confidences) if confidences else 0,
+                'hidden_connections': sum(
+                    1 for edge in edge_path if relationship_map[edge].get('hidden_knowledge', False)
+                ),
+                'node_details': [entity_details[node_id] for node_id in node_path],
+                'edge_details': [relationship_map[edge] for edge in edge_path]
+            })
+            continue
+        if len(node_path) > max_depth:
+            continue
+        for neighbor in adjacency.get(current, []):
+            if neighbor not in node_path:
+                queue.append((node_path + [neighbor], edge_path + [f"{current}->{neighbor}"]))
+
+    paths.sort(key=lambda p: (p['confidence'], -p['length']), reverse=True)
+    return paths
+
+
+@pytest.fixture(scope='module')
+def seed_graph():
+    with open(SEED_GRAPH_PATH, 'r') as f:
+        return json.load(f)
+
+
+def layered_graph(width, layers):
+    """S -> `layers` fully connected layers of `width` nodes -> T (width**layers paths)"""
+    entities = [{'id': 'S', 'name': 'S', 'type': 'drug'}, {'id': 'T', 'name': 'T', 'type': 'disease'}]
+    relationships = []
+    previous = ['S']
+    for layer in range(layers):
+        current = [f'L{layer}_{i}' for i in range(width)]
+        entities += [{'id': node, 'name': node, 'type': 'protein'} for node in current]
+        relationships += [
+            {'source': a, 'target': b, 'relation': 'activates', 'confidence': 0.5 + 0.05 * ((i + j) % 9)}
+            for i, a in enumerate(previous)
+            for j, b in enumerate(current)
+        ]
+        previous = current
+    relationships += [{'source': a, 'target': 'T', 'relation': 'treats', 'confidence': 0.9} for a in previous]
+    return {'entities': entities, 'relationships': relationships}
+
+
+def peak_memory(fn):
+    tracemalloc.start()
+    try:
+        result = fn()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current, peak
+
+
+def entity_pairs(graph):
+    names = [e['name'] for e in graph['entities']]
+    return [(a, b) for a in names for b in names if a != b]
+
+
+def test_matches_reference_bfs(seed_graph):
+    graph_index = build_graph_index(seed_graph)
+    for start, target in entity_pairs(seed_graph):
+        expected = reference_bfs(graph_index, start, target, 10)
+        assert bfs_find_paths(seed_graph, start, target, max_depth=10) == expected, (start, target)
+
+
+def test_wire_round_trip(seed_graph):
+    for start, target in entity_pairs(seed_graph):
+        path_set = bfs_find_path_set(seed_graph, start, target, max_depth=10)
+        wire = json.loads(json.dumps(path_set.to_wire()))
+        assert list(PathSet.from_wire(wire)) == list(path_set), (start, target)
+        assert wire['total_paths'] == len(path_set)
+
+
+def test_top_k_and_slicing(seed_graph):
+    path_set = bfs_find_path_set(seed_graph, 'Semaglutide', 'Metabolic Syndrome', max_depth=10)
+    paths = list(path_set)
+
+    assert len(paths) > 2
+    assert path_set.top_k(2) == paths[:2]
+    assert path_set[0:2] == paths[:2]
+    assert path_set[-1] == paths[-1]
+    assert len(PathSet.from_wire(path_set.to_wire(2))) == 2
+
+    with pytest.raises(ValueError):
+        path_set.to_wire(-1)
+
+
+def test_memory_below_list_bfs():
+    graph = layered_graph(width=6, layers=5)
+    graph_index = build_graph_index(graph)
+
+    expected, list_held, list_peak = peak_memory(lambda: reference_bfs(graph_index, 'S', 'T', 10))
+    path_set, trie_held, trie_peak = peak_memory(
+        lambda: bfs_find_path_set(graph, 'S', 'T', max_depth=10, graph_index=graph_index)
+    )
+
+    assert len(path_set) == len(expected) == 6 ** 5
+    assert path_set.trie_size() < sum(p['length'] + 1 for p in expected)
+    assert trie_peak < list_peak / 2
+    assert trie_held < list_held / 4
+    assert list(path_set) == expected
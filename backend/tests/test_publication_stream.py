@@ -0,0 +1,193 @@
+"""
+Streaming publication ingest with a stub triplet extractor
+"""
+import io
+import os
+import sys
+import zipfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+import publication_stream
+from publication_stream import PublicationIngest, TextChunker
+
+
+def stub_extractor(calls):
+    def extract(text):
+        calls.append(text)
+        return [{'subject': 'A', 'predicate': 'binds', 'object': 'B', 'text': text[:10]}]
+    return extract
+
+
+def events_by_step(events, step):
+    return [e for e in events if e['step'] == step]
+
+
+def make_zip(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def split(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def test_chunker_prefers_paragraph_then_line_boundaries():
+    chunker = TextChunker(max_chars=10)
+
+    assert chunker.feed('abc\n\ndefgh') == []
+    assert chunker.feed('ij\nklmnop') == ['abc', 'defghij']
+    assert chunker.feed('qrstuvwxyz') == ['klmnopqrst']
+    assert chunker.flush() == ['uvwxyz']
+
+
+def test_chunker_hard_cuts_and_skips_blank_remainder():
+    chunker = TextChunker(max_chars=4)
+
+    assert chunker.feed('abcdefghij') == ['abcd', 'efgh']
+    assert chunker.flush() == ['ij']
+    assert chunker.feed('\n \n') == []
+    assert chunker.flush() == []
+
+
+def test_multibyte_characters_split_across_reads():
+    text = 'Semaglutide → GLP-1 receptor. Ünïcødé ✓ 治疗\n' * 50
+    calls = []
+    ingest = PublicationIngest(stub_extractor(calls), max_chars=300)
+
+    # 7-byte reads split most multibyte sequences
+    events = list(ingest.ingest_raw(split(text.encode('utf-8'), 7), 'paper.txt'))
+
+    assert ''.join(calls).replace('\n', '') == text.replace('\n', '')
+    assert all(len(chunk) <= 300 for chunk in calls)
+    assert events_by_step(events, 'file_error') == []
+    complete = events_by_step(events, 'file_complete')
+    assert complete[0]['characters'] == len(text)
+    assert complete[0]['triplet_count'] == len(calls)
+
+
+def test_invalid_utf8_is_a_file_error():
+    ingest = PublicationIngest(stub_extractor([]))
+
+    events = list(ingest.ingest_raw([b'abc\xff\xfe'], 'paper.txt'))
+
+    errors = events_by_step(events, 'file_error')
+    assert errors[0]['filename'] == 'paper.txt'
+    assert 'UTF-8' in errors[0]['message']
+    assert events[-1]['files'][0]['success'] is False
+
+
+def test_multipart_files_and_complete_summary():
+    boundary = b'testboundary'
+    body = (
+        b'--testboundary\r\n'
+        b'Content-Disposition: form-data; name="note"\r\n\r\n'
+        b'ignored\r\n'
+        b'--testboundary\r\n'
+        b'Content-Disposition: form-data; name="files"; filename="a.txt"\r\n'
+        b'Content-Type: text/plain\r\n\r\n'
+        b'first paper\r\n'
+        b'--testboundary\r\n'
+        b'Content-Disposition: form-data; name="files"; filename="b.txt"\r\n'
+        b'Content-Type: text/plain\r\n\r\n'
+        b'second paper\r\n'
+        b'--testboundary--\r\n'
+    )
+    calls = []
+    ingest = PublicationIngest(stub_extractor(calls))
+
+    events = list(ingest.ingest_multipart(split(body, 16), boundary, content_length=len(body)))
+
+    assert sorted(calls) == ['first paper', 'second paper']
+    assert [e['filename'] for e in events_by_step(events, 'file_started')] == ['a.txt', 'b.txt']
+    assert all(0 <= e['progress'] <= 99 for e in events_by_step(events, 'progress'))
+
+    complete = events[-1]
+    assert complete['step'] == 'complete'
+    assert complete['progress'] == 100
+    assert complete['triplet_count'] == 2
+    assert complete['files'] == [
+        {'filename': 'a.txt', 'characters': 11, 'triplet_count': 1, 'success': True},
+        {'filename': 'b.txt', 'characters': 12, 'triplet_count': 1, 'success': True}
+    ]
+
+
+def test_extraction_error_fails_only_that_file():
+    def extract(text):
+        if 'bad' in text:
+            raise RuntimeError('model overloaded')
+        return []
+
+    ingest = PublicationIngest(extract)
+    archive = make_zip({'good.txt': b'good paper', 'bad.txt': b'bad paper'})
+
+    events = list(ingest.ingest_raw([archive], 'papers.zip'))
+
+    errors = events_by_step(events, 'file_error')
+    assert [(e['filename'], e['message']) for e in errors] == [('papers.zip/bad.txt', 'model overloaded')]
+    assert [e['filename'] for e in events_by_step(events, 'file_complete')] == ['papers.zip/good.txt']
+    assert [f['success'] for f in events[-1]['files']] == [True, False]
+
+
+def test_zip_extracts_text_members_only():
+    calls = []
+    ingest = PublicationIngest(stub_extractor(calls))
+    archive = make_zip({
+        'papers/one.txt': b'paper one',
+        'papers/two.md': b'paper two',
+        'papers/figure.png': b'\x89PNG',
+        'papers/empty/': b''
+    })
+
+    events = list(ingest.ingest_raw(split(archive, 100), 'papers.zip'))
+
+    assert sorted(calls) == ['paper one', 'paper two']
+    assert [e['filename'] for e in events_by_step(events, 'file_skipped')] == ['papers.zip/papers/figure.png']
+    assert [f['filename'] for f in events[-1]['files']] == ['papers.zip/papers/one.txt', 'papers.zip/papers/two.md']
+
+
+def test_archive_member_limit(monkeypatch):
+    monkeypatch.setattr(publication_stream, 'MAX_ARCHIVE_MEMBERS', 2)
+    calls = []
+    ingest = PublicationIngest(stub_extractor(calls))
+    archive = make_zip({f'{i}.txt': f'paper {i}'.encode() for i in range(5)})
+
+    events = list(ingest.ingest_raw([archive], 'papers.zip'))
+
+    assert len(calls) == 2
+    errors = events_by_step(events, 'file_error')
+    assert [e['filename'] for e in errors] == ['papers.zip']
+    assert 'more than 2 text files' in errors[0]['message']
+    assert events[-1]['step'] == 'complete'
+
+
+def test_archive_byte_limit(monkeypatch):
+    monkeypatch.setattr(publication_stream, 'MAX_ARCHIVE_BYTES', 1000)
+    monkeypatch.setattr(publication_stream, 'READ_CHUNK_SIZE', 100)
+    ingest = PublicationIngest(stub_extractor([]))
+    # Compresses to a few bytes; expansion must stop at the limit
+    archive = make_zip({'bomb.txt': b'a' * 10 ** 6})
+
+    events = list(ingest.ingest_raw([archive], 'papers.zip'))
+
+    errors = events_by_step(events, 'file_error')
+    assert [e['filename'] for e in errors] == ['papers.zip/bomb.txt', 'papers.zip']
+    assert 'Archive too large' in errors[1]['message']
+    assert events[-1]['files'] == [
+        {'filename': 'papers.zip/bomb.txt', 'characters': 1000, 'triplet_count': 0, 'success': False}
+    ]
+
+
+def test_corrupt_archive_is_a_file_error():
+    ingest = PublicationIngest(stub_extractor([]))
+
+    events = list(ingest.ingest_raw([b'not a zip file'], 'papers.zip'))
+
+    errors = events_by_step(events, 'file_error')
+    assert errors[0]['filename'] == 'papers.zip'
+    assert errors[0]['message'].startswith('Could not read archive')
+    assert events[-1]['files'] == []
@@ -4,23 +4,18 @@ Graph traversal and analysis tools
 from typing import List, Dict, Any, Optional
 from collections import deque
 
-def bfs_find_paths(
-    graph_data: Dict[str, Any],
-    start_entity: str,
-    target_entity: str,
-    max_depth: int = 6
-) -> List[Dict[str, Any]]:
+from tools.path_set import PathSet
+
+def build_graph_index(graph_data: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Find all paths between start and target entities using BFS
-    
+    Build the lookup tables used by path search
+
     Args:
         graph_data: Dictionary with 'entities' and 'relationships'
-        start_entity: Starting entity name (e.g., "Semaglutide")
-        target_entity: Target entity name (e.g., "Obesity")
-        max_depth: Maximum path length to search
-    
+
     Returns:
-        List of paths, each containing nodes and edges
+        Dictionary with 'adjacency', 'relationship_map', 'entity_map'
+        (name -> id) and 'entity_details' (id -> entity)
     """
     
     # Build adjacency list from relationships
@@ -30,13 +25,13 @@ def bfs_find_paths(
     for rel in graph_data['relationships']:
         source = rel['source']
         target = rel['target']
+        edge_key = f"{source}->{target}"
         
         if source not in adjacency:
             adjacency[source] = []
         adjacency[source].append(target)
         
         # Store relationship details (including metadata)
-        edge_key = f"{source}->{target}"
         relationship_map[edge_key] = {
             'relation': rel['relation'],
             'confidence': rel.get('confidence', 0.5),
@@ -46,73 +41,103 @@ def bfs_find_paths(
             'domain': rel.get('domain', 'unknown')
         }
     
-    # Find entity IDs from names
-    entity_map = {e['name']: e['id'] for e in graph_data['entities']}
-    entity_details = {e['id']: e for e in graph_data['entities']}
+    return {
+        'adjacency': adjacency,
+        'relationship_map': relationship_map,
+        'entity_map': {e['name']: e['id'] for e in graph_data['entities']},
+        'entity_details': {e['id']: e for e in graph_data['entities']}
+    }
+
+
+def bfs_find_path_set(
+    graph_data: Dict[str, Any],
+    start_entity: str,
+    target_entity: str,
+    max_depth: int = 6,
+    graph_index: Optional[Dict[str, Any]] = None
+) -> PathSet:
+    """
+    Find all paths between start and target entities using BFS
+    
+    Paths are stored in a prefix-shared PathSet instead of a list of
+    independent dicts, which keeps large result sets small.
+    
+    Args:
+        graph_data: Dictionary with 'entities' and 'relationships'
+        start_entity: Starting entity name (e.g., "Semaglutide")
+        target_entity: Target entity name (e.g., "Obesity")
+        max_depth: Maximum path length to search
+        graph_index: Prebuilt `build_graph_index` output (built if omitted)
+    
+    Returns:
+        PathSet ranked by confidence and path length
+    """
+    
+    if graph_index is None:
+        graph_index = build_graph_index(graph_data)
+    
+    adjacency = graph_index['adjacency']
+    entity_map = graph_index['entity_map']
+    path_set = PathSet(graph_index['entity_details'], graph_index['relationship_map'])
     
     start_id = entity_map.get(start_entity)
     target_id = entity_map.get(target_entity)
     
     if not start_id or not target_id:
         print(f"❌ Entity not found: start={start_entity}, target={target_entity}")
-        return []
+        return path_set
     
     print(f"🔍 Searching paths: {start_entity} ({start_id}) → {target_entity} ({target_id})")
     
-    # BFS to find all paths
-    paths = []
-    queue = deque([([start_id], [])])  # (node_path, edge_path)
+    # BFS over trie indices; each queue entry is the end of a partial path
+    queue = deque([path_set.add_root(start_id)])
     
     while queue:
-        node_path, edge_path = queue.popleft()
-        current = node_path[-1]
+        index = queue.popleft()
+        current = path_set.node_id(index)
         
         # Check if we've reached target
         if current == target_id:
-            # Calculate path confidence (average of edge confidences)
-            confidences = [relationship_map[edge]['confidence'] for edge in edge_path]
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-            
-            # Build path details
-            hidden_count = sum(
-                1 for edge in edge_path 
-                if relationship_map[edge].get('hidden_knowledge', False)
-            )
-            # Build path details
-            path_details = {
-                'nodes': node_path,
-                'edges': edge_path,
-                'length': len(node_path) - 1,
-                'confidence': avg_confidence,
-                'hidden_connections': hidden_count,  # ← Add this line
-                'node_details': [entity_details[node_id] for node_id in node_path],
-                'edge_details': [relationship_map[edge] for edge in edge_path]
-            }
-            
-            
-            paths.append(path_details)
+            path_set.mark_complete(index)
             continue
         
         # Don't search beyond max depth
-        if len(node_path) > max_depth:
+        if path_set.depth(index) + 1 > max_depth:
             continue
         
         # Explore neighbors
         if current in adjacency:
             for neighbor in adjacency[current]:
                 # Avoid cycles
-                if neighbor not in node_path:
-                    edge_key = f"{current}->{neighbor}"
-                    queue.append((
-                        node_path + [neighbor],
-                        edge_path + [edge_key]
-                    ))
+                if not path_set.contains(index, neighbor):
+                    queue.append(path_set.extend(index, neighbor))
     
     # Sort by confidence and path length
-    paths.sort(key=lambda p: (p['confidence'], -p['length']), reverse=True)
+    path_set.finalize()
     
-    print(f"✓ Found {len(paths)} paths")
-    return paths
+    print(f"✓ Found {len(path_set)} paths")
+    return path_set
+
+
+def bfs_find_paths(
+    graph_data: Dict[str, Any],
+    start_entity: str,
+    target_entity: str,
+    max_depth: int = 6
+) -> List[Dict[str, Any]]:
+    """
+    Find all paths between start and target entities using BFS
+    
+    Args:
+        graph_data: Dictionary with 'entities' and 'relationships'
+        start_entity: Starting entity name (e.g., "Semaglutide")
+        target_entity: Target entity name (e.g., "Obesity")
+        max_depth: Maximum path length to search
+    
+    Returns:
+        List of paths, each containing nodes and edges
+    """
+    return list(bfs_find_path_set(graph_data, start_entity, target_entity, max_depth))
 
 
 def generate_mechanism_summary(path: Dict[str, Any]) -> str:
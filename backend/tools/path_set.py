@@ -0,0 +1,257 @@
+"""
+Compact, prefix-shared storage for graph search results
+"""
+from array import array
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Union
+
+
+class PathSet:
+    """
+    Set of drug → disease paths stored as a prefix trie over node IDs
+
+    Paths found by BFS share long prefixes, so each trie node holds a single
+    graph node ID plus a pointer to its parent. Per-node numbers live in
+    typed arrays rather than Python objects. Entity and edge details are
+    kept once in lookup tables and full per-path dicts (the format returned
+    by `bfs_find_paths`) are only built when a path is accessed.
+
+    BFS extends every partial path exactly once, so nodes are appended
+    without a child lookup; `extend` never merges equal prefixes.
+    """
+
+    def __init__(
+        self,
+        entity_details: Dict[str, Dict[str, Any]],
+        relationship_map: Dict[str, Dict[str, Any]]
+    ):
+        self.entity_details = entity_details
+        self.relationship_map = relationship_map
+
+        # Trie nodes, one entry per index
+        self._node_ids: List[str] = []
+        self._parents = array('l')
+        self._depths = array('i')
+        self._confidence_sums = array('d')
+        self._hidden_counts = array('i')
+
+        # Trie indices of complete paths, ranked after finalize()
+        self._terminals = array('l')
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def add_root(self, node_id: str) -> int:
+        """Add a root trie node and return its index"""
+        return self._new_node(node_id, -1, 0, 0.0, 0)
+
+    def extend(self, parent: int, node_id: str) -> int:
+        """Add a trie node for `parent` followed by `node_id` and return its index"""
+        edge = self.relationship_map[f"{self._node_ids[parent]}->{node_id}"]
+        return self._new_node(
+            node_id,
+            parent,
+            self._depths[parent] + 1,
+            self._confidence_sums[parent] + edge['confidence'],
+            self._hidden_counts[parent] + (1 if edge.get('hidden_knowledge', False) else 0)
+        )
+
+    def contains(self, index: int, node_id: str) -> bool:
+        """Check whether `node_id` appears on the path ending at `index`"""
+        while index != -1:
+            if self._node_ids[index] == node_id:
+                return True
+            index = self._parents[index]
+        return False
+
+    def node_id(self, index: int) -> str:
+        return self._node_ids[index]
+
+    def depth(self, index: int) -> int:
+        return self._depths[index]
+
+    def mark_complete(self, index: int) -> None:
+        """Record the path ending at `index` as a result"""
+        self._terminals.append(index)
+
+    def finalize(self) -> 'PathSet':
+        """
+        Drop search prefixes that did not lead to a result and rank paths
+        by confidence and path length (same order as `bfs_find_paths`)
+        """
+        self._compact()
+        ranked = sorted(
+            self._terminals,
+            key=lambda t: (self._confidence(t), -self._depths[t]),
+            reverse=True
+        )
+        self._terminals = array('l', ranked)
+        return self
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._terminals)
+
+    def __bool__(self) -> bool:
+        return bool(self._terminals)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for terminal in self._terminals:
+            yield self._materialize(terminal)
+
+    def __getitem__(self, rank: Union[int, slice]) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        if isinstance(rank, slice):
+            return [self._materialize(t) for t in self._terminals[rank]]
+        return self._materialize(self._terminals[rank])
+
+    def top_k(self, k: int) -> List[Dict[str, Any]]:
+        """Return the k best paths as full path dicts"""
+        return [self._materialize(t) for t in self._terminals[:k]]
+
+    def trie_size(self) -> int:
+        """Number of stored trie nodes (vs. sum of path lengths for a list)"""
+        return len(self._node_ids)
+
+    # ------------------------------------------------------------------
+    # Wire format
+    # ------------------------------------------------------------------
+
+    def to_wire(self, k: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Compact JSON-serializable representation
+
+        Format:
+            entities: {node_id: entity}        - referenced entities, once each
+            edges:    {"SRC->TGT": details}    - referenced edges, once each
+            trie:     [[node_id, parent], ...] - parent is -1 for the root
+            paths:    [[trie_index, confidence, length, hidden_connections], ...]
+                      ranked best first
+        """
+        if k is not None and k < 0:
+            raise ValueError(f"k must be non-negative, got {k}")
+        terminals = self._terminals if k is None else self._terminals[:k]
+
+        # Keep only trie nodes on the selected paths, parents before children
+        keep = self._ancestors(terminals)
+        ordered = [index for index in range(len(keep)) if keep[index]]
+        remap = {old: new for new, old in enumerate(ordered)}
+
+        trie = []
+        entities = {}
+        edges = {}
+        for old in ordered:
+            node_id = self._node_ids[old]
+            parent = self._parents[old]
+            trie.append([node_id, remap[parent] if parent != -1 else -1])
+            entities[node_id] = self.entity_details[node_id]
+            if parent != -1:
+                edge_key = f"{self._node_ids[parent]}->{node_id}"
+                edges[edge_key] = self.relationship_map[edge_key]
+
+        return {
+            'entities': entities,
+            'edges': edges,
+            'trie': trie,
+            'paths': [
+                [remap[t], self._confidence(t), self._depths[t], self._hidden_counts[t]]
+                for t in terminals
+            ],
+            'total_paths': len(self._terminals)
+        }
+
+    @classmethod
+    def from_wire(cls, wire: Dict[str, Any]) -> 'PathSet':
+        """Rebuild a PathSet from `to_wire` output"""
+        path_set = cls(wire['entities'], wire['edges'])
+        for node_id, parent in wire['trie']:
+            if parent == -1:
+                path_set.add_root(node_id)
+            else:
+                path_set.extend(parent, node_id)
+        path_set._terminals = array('l', (path[0] for path in wire['paths']))
+        return path_set
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _new_node(
+        self,
+        node_id: str,
+        parent: int,
+        depth: int,
+        confidence_sum: float,
+        hidden_count: int
+    ) -> int:
+        self._node_ids.append(node_id)
+        self._parents.append(parent)
+        self._depths.append(depth)
+        self._confidence_sums.append(confidence_sum)
+        self._hidden_counts.append(hidden_count)
+        return len(self._node_ids) - 1
+
+    def _confidence(self, index: int) -> float:
+        # Average of edge confidences
+        depth = self._depths[index]
+        return self._confidence_sums[index] / depth if depth else 0
+
+    def _node_path(self, index: int) -> List[str]:
+        node_path = []
+        while index != -1:
+            node_path.append(self._node_ids[index])
+            index = self._parents[index]
+        node_path.reverse()
+        return node_path
+
+    def _materialize(self, index: int) -> Dict[str, Any]:
+        node_path = self._node_path(index)
+        edge_path = [f"{a}->{b}" for a, b in zip(node_path, node_path[1:])]
+        return {
+            'nodes': node_path,
+            'edges': edge_path,
+            'length': self._depths[index],
+            'confidence': self._confidence(index),
+            'hidden_connections': self._hidden_counts[index],
+            'node_details': [self.entity_details[node_id] for node_id in node_path],
+            'edge_details': [self.relationship_map[edge] for edge in edge_path]
+        }
+
+    def _ancestors(self, terminals: Iterable[int]) -> bytearray:
+        # Flags for trie nodes on any of the given paths
+        keep = bytearray(len(self._node_ids))
+        for terminal in terminals:
+            index = terminal
+            while index != -1 and not keep[index]:
+                keep[index] = 1
+                index = self._parents[index]
+        return keep
+
+    def _compact(self) -> None:
+        # Drop nodes that are not on a complete path, in place. Parents
+        # always precede their children, so every kept node moves to an
+        # index <= its old one and its parent has already been remapped.
+        keep = self._ancestors(self._terminals)
+        remap = array('l', [0]) * len(keep)
+
+        size = 0
+        for old in range(len(keep)):
+            if not keep[old]:
+                continue
+            parent = self._parents[old]
+            remap[old] = size
+            self._node_ids[size] = self._node_ids[old]
+            self._parents[size] = remap[parent] if parent != -1 else -1
+            self._depths[size] = self._depths[old]
+            self._confidence_sums[size] = self._confidence_sums[old]
+            self._hidden_counts[size] = self._hidden_counts[old]
+            size += 1
+
+        del self._node_ids[size:]
+        del self._parents[size:]
+        del self._depths[size:]
+        del self._confidence_sums[size:]
+        del self._hidden_counts[size:]
+        self._terminals = array('l', (remap[t] for t in self._terminals))
@@ -27,7 +27,10 @@ def main():
     print("✅ Using pre-built frontend from git")
     
     # Import and run Flask app
-    from backend.app import app
+    from backend.app import app, start_background_init
+    
+    # Warm up subsystems (incl. batch job workers) without blocking startup
+    start_background_init(include_jobs=True)
     
     # Get port from CML environment
     port = int(os.environ.get('CDSW_APP_PORT', 8080))
@@ -10,31 +10,73 @@ interface Triplet {
   source_sentence: string
 }
 
-interface UploadResult {
-  success: boolean
+interface FileResult {
   filename: string
-  content: string
-  triplets?: Triplet[]
-  triplet_count?: number
-  error?: string
+  status: 'processing' | 'complete' | 'skipped' | 'error'
+  characters?: number
+  triplets: Triplet[]
+  message?: string
 }
 
 export function PublicationUpload() {
   const [uploading, setUploading] = useState(false)
-  const [result, setResult] = useState<UploadResult | null>(null)
+  const [progress, setProgress] = useState(0)
+  const [files, setFiles] = useState<FileResult[]>([])
+  const [error, setError] = useState<string | null>(null)
+
+  const updateFile = (filename: string, update: (file: FileResult) => FileResult) => {
+    setFiles(prev => {
+      const existing = prev.find(f => f.filename === filename)
+      if (!existing) {
+        return [...prev, update({ filename, status: 'processing', triplets: [] })]
+      }
+      return prev.map(f => (f.filename === filename ? update(f) : f))
+    })
+  }
+
+  const handleEvent = (data: any) => {
+    switch (data.step) {
+      case 'progress':
+        if (data.progress !== undefined) setProgress(data.progress)
+        break
+      case 'file_started':
+        updateFile(data.filename, f => f)
+        break
+      case 'triplets':
+        updateFile(data.filename, f => ({ ...f, triplets: [...f.triplets, ...data.triplets] }))
+        break
+      case 'file_complete':
+        updateFile(data.filename, f => ({ ...f, status: 'complete', characters: data.characters }))
+        break
+      case 'file_skipped':
+        updateFile(data.filename, f => ({ ...f, status: 'skipped', message: data.message }))
+        break
+      case 'file_error':
+        updateFile(data.filename, f => ({ ...f, status: 'error', message: data.message }))
+        break
+      case 'complete':
+        setProgress(100)
+        break
+      case 'error':
+        setError(data.message)
+        break
+    }
+  }
 
   const handleFileUpload = async (event: React.ChangeEvent<HTMLInputElement>) => {
-    const file = event.target.files?.[0]
-    if (!file) return
+    const selected = Array.from(event.target.files ?? [])
+    if (selected.length === 0) return
 
     setUploading(true)
-    setResult(null)
+    setProgress(0)
+    setFiles([])
+    setError(null)
 
     try {
       const formData = new FormData()
-      formData.append('file', file)
+      selected.forEach(file => formData.append('files', file))
 
-      const response = await fetch('/api/upload-publication', {
+      const response = await fetch('/api/upload-publications-stream', {
         method: 'POST',
         body: formData
       })
@@ -43,15 +85,32 @@ export function PublicationUpload() {
         throw new Error(`Upload failed: ${response.statusText}`)
       }
 
-      const data = await response.json()
-      setResult(data)
-    } catch (error) {
-      setResult({
-        success: false,
-        filename: file.name,
-        content: '',
-        error: error instanceof Error ? error.message : 'Upload failed'
-      })
+      const reader = response.body?.getReader()
+      const decoder = new TextDecoder()
+
+      if (!reader) {
+        throw new Error('Response body is not readable')
+      }
+
+      // Events can span reads, so keep the incomplete tail for the next one
+      let buffer = ''
+      while (true) {
+        const { done, value } = await reader.read()
+
+        if (done) break
+
+        buffer += decoder.decode(value, { stream: true })
+        const events = buffer.split('\n\n')
+        buffer = events.pop() ?? ''
+
+        for (const line of events) {
+          if (line.startsWith('data: ')) {
+            handleEvent(JSON.parse(line.substring(6)))
+          }
+        }
+      }
+    } catch (err) {
+      setError(err instanceof Error ? err.message : 'Upload failed')
     } finally {
       setUploading(false)
     }
@@ -71,14 +130,15 @@ export function PublicationUpload() {
   return (
     <div className="bg-white rounded-lg shadow-lg p-6">
       <h2 className="text-xl font-semibold mb-4">📄 Upload Publication</h2>
-      
+
       <div className="mb-4">
         <label className="block mb-2 text-sm font-medium text-gray-700">
-          Select a scientific publication (TXT or PDF)
+          Select scientific publications (TXT, or ZIP/TAR archives of TXT files)
         </label>
         <input
           type="file"
-          accept=".txt,.pdf"
+          accept=".txt,.md,.zip,.tar,.gz,.tgz"
+          multiple
           onChange={handleFileUpload}
           disabled={uploading}
           className="block w-full text-sm text-gray-900 border border-gray-300 rounded-lg cursor-pointer bg-gray-50 focus:outline-none p-2"
@@ -86,74 +146,82 @@ export function PublicationUpload() {
       </div>
 
       {uploading && (
-        <div className="flex items-center justify-center py-8">
-          <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-purple-600"></div>
-          <span className="ml-3 text-gray-600">Extracting knowledge with Claude AI...</span>
+        <div className="py-4">
+          <div className="flex items-center justify-center">
+            <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-purple-600"></div>
+            <span className="ml-3 text-gray-600">Extracting knowledge with Claude AI...</span>
+          </div>
+          <div className="mt-3 w-full bg-gray-200 rounded-full h-2">
+            <div className="bg-purple-600 h-2 rounded-full" style={{ width: `${progress}%` }}></div>
+          </div>
         </div>
       )}
 
-      {result && result.success && (
+      {files.length > 0 && (
         <div className="mt-4 space-y-4">
-          <div className="bg-green-50 border border-green-200 rounded-lg p-4">
-            <p className="text-green-800 font-medium">
-              ✓ Successfully processed: {result.filename}
-            </p>
-            <p className="text-green-700 text-sm mt-1">
-              Extracted {result.triplet_count} knowledge triplets
-            </p>
-          </div>
-
-          {/* Extracted Triplets */}
-          {result.triplets && result.triplets.length > 0 && (
-            <div className="bg-white border border-gray-200 rounded-lg p-4">
-              <h3 className="font-semibold mb-3 text-gray-700">
-                🧠 Extracted Knowledge Triplets:
-              </h3>
-              <div className="space-y-3 max-h-96 overflow-y-auto">
-                {result.triplets.map((triplet, index) => (
-                  <div key={index} className="border-l-4 border-purple-400 bg-gray-50 p-3 rounded">
-                    <div className="flex items-center gap-2 flex-wrap mb-2">
-                      <span className={`px-2 py-1 rounded text-xs font-medium ${getTypeColor(triplet.subject_type)}`}>
-                        {triplet.subject}
-                      </span>
-                      <span className="text-gray-600 text-sm font-mono">
-                        {triplet.predicate}
-                      </span>
-                      <span className={`px-2 py-1 rounded text-xs font-medium ${getTypeColor(triplet.object_type)}`}>
-                        {triplet.object}
-                      </span>
-                      <span className="ml-auto text-xs text-gray-500">
-                        {(triplet.confidence * 100).toFixed(0)}% confidence
-                      </span>
-                    </div>
-                    <p className="text-xs text-gray-600 italic">
-                      "{triplet.source_sentence.substring(0, 150)}{triplet.source_sentence.length > 150 ? '...' : ''}"
-                    </p>
+          {files.map(file => (
+            <div key={file.filename} className="space-y-4">
+              {file.status === 'error' || file.status === 'skipped' ? (
+                <div className="bg-red-50 border border-red-200 rounded-lg p-4">
+                  <p className="text-red-800 font-medium">
+                    {file.status === 'error' ? '❌' : '⏭️'} {file.filename}: {file.message}
+                  </p>
+                </div>
+              ) : (
+                <div className="bg-green-50 border border-green-200 rounded-lg p-4">
+                  <p className="text-green-800 font-medium">
+                    {file.status === 'complete' ? '✓ Successfully processed' : '⏳ Processing'}: {file.filename}
+                  </p>
+                  <p className="text-green-700 text-sm mt-1">
+                    Extracted {file.triplets.length} knowledge triplets
+                    {file.characters !== undefined && ` from ${file.characters} characters`}
+                  </p>
+                </div>
+              )}
+
+              {/* Extracted Triplets */}
+              {file.triplets.length > 0 && (
+                <div className="bg-white border border-gray-200 rounded-lg p-4">
+                  <h3 className="font-semibold mb-3 text-gray-700">
+                    🧠 Extracted Knowledge Triplets:
+                  </h3>
+                  <div className="space-y-3 max-h-96 overflow-y-auto">
+                    {file.triplets.map((triplet, index) => (
+                      <div key={index} className="border-l-4 border-purple-400 bg-gray-50 p-3 rounded">
+                        <div className="flex items-center gap-2 flex-wrap mb-2">
+                          <span className={`px-2 py-1 rounded text-xs font-medium ${getTypeColor(triplet.subject_type)}`}>
+                            {triplet.subject}
+                          </span>
+                          <span className="text-gray-600 text-sm font-mono">
+                            {triplet.predicate}
+                          </span>
+                          <span className={`px-2 py-1 rounded text-xs font-medium ${getTypeColor(triplet.object_type)}`}>
+                            {triplet.object}
+                          </span>
+                          <span className="ml-auto text-xs text-gray-500">
+                            {(triplet.confidence * 100).toFixed(0)}% confidence
+                          </span>
+                        </div>
+                        <p className="text-xs text-gray-600 italic">
+                          "{triplet.source_sentence.substring(0, 150)}{triplet.source_sentence.length > 150 ? '...' : ''}"
+                        </p>
+                      </div>
+                    ))}
                   </div>
-                ))}
-              </div>
+                </div>
+              )}
             </div>
-          )}
-
-          {/* Content Preview */}
-          <details className="bg-gray-50 border border-gray-200 rounded-lg p-4">
-            <summary className="font-semibold cursor-pointer text-gray-700">
-              View Original Text ({result.content.length} characters)
-            </summary>
-            <div className="mt-2 text-sm text-gray-600 max-h-60 overflow-y-auto whitespace-pre-wrap font-mono">
-              {result.content}
-            </div>
-          </details>
+          ))}
         </div>
       )}
 
-      {result && !result.success && (
+      {error && (
         <div className="mt-4 bg-red-50 border border-red-200 rounded-lg p-4">
           <p className="text-red-800 font-medium">
-            ❌ Error: {result.error}
+            ❌ Error: {error}
           </p>
         </div>
       )}
     </div>
   )
-}
\ No newline at end of file
+}